@@ -1,7 +1,8 @@
 import streamlit as st
-from supervisor_agent import run_graph
-import time
-from langchain_core.messages import HumanMessage
+from jobs import get_job_queue, DONE
+from report_writers import REPORT_WRITERS
+from sites import source_names
+import json
 
 st.set_page_config(
     page_title="Research Agent Supervisor",
@@ -44,8 +45,9 @@ with st.sidebar:
 
     websites_to_visit = st.multiselect(
         "Websites to Scrape",
-        ['IEEE', 'Springer', 'MDPI'],
-        default=['IEEE']
+        source_names(),
+        default=['IEEE'],
+        help="'Local' searches the papers collected by earlier runs, without visiting any website."
     )
 
     page_nos_to_search = st.number_input(
@@ -64,6 +66,31 @@ with st.sidebar:
         help="How many article links to follow and scrape from each search results page."
     )
 
+    streaming = st.checkbox(
+        "Summarize while scraping",
+        value=False,
+        help="Start summarizing each article as soon as it is scraped instead of waiting for all websites to finish."
+    )
+
+    chunked = st.checkbox(
+        "Chunked summarization",
+        value=False,
+        help="Split long articles into chunks that are summarized in parallel and then combined. Recommended for 'Max' depth."
+    )
+
+    report_format = st.selectbox(
+        "Report format",
+        options=list(REPORT_WRITERS),
+        format_func=lambda key: REPORT_WRITERS[key].label,
+        help="Word reports take longest to build; Markdown, HTML and JSON Lines are written much faster for large reports."
+    )
+
+    resume = st.checkbox(
+        "Resume previous run",
+        value=True,
+        help="If a run with the same settings was interrupted or finished recently, reuse its scraped articles and summaries."
+    )
+
 st.title("Research Agent Supervisor")
 st.write("Configure the agent using the sidebar, then click 'Generate Report' to begin.")
 
@@ -72,6 +99,7 @@ if 'report_generated' not in st.session_state:
     st.session_state.report_bytes = None
     st.session_state.report_name = ""
     st.session_state.final_state = None
+    st.session_state.job_id = None
 
 if st.button("Generate Report", type="primary", use_container_width=True):
     if not prompt:
@@ -79,36 +107,68 @@ if st.button("Generate Report", type="primary", use_container_width=True):
     elif not websites_to_visit:
         st.error("Please select at least one website to visit in the sidebar.")
     else:
+        from langchain_core.messages import HumanMessage
+
         st.session_state.report_generated = False
         st.session_state.final_state = None
 
-        with st.status("Your research agent is at work...", expanded=True) as status:
-            try:
-                start_time = time.time()
-
-                final_state = run_graph(
-                    prompt=[HumanMessage(content=prompt)],
-                    summarization_depth=summarization_depth,
-                    pages_to_search=page_nos_to_search,
-                    page_depth=page_depth,
-                    websites_to_search=websites_to_visit,
-                    model=model,
-                    status_ui=status
-                )
+        job = get_job_queue().submit(
+            prompt=[HumanMessage(content=prompt)],
+            summarization_depth=summarization_depth,
+            pages_to_search=page_nos_to_search,
+            page_depth=page_depth,
+            websites_to_search=websites_to_visit,
+            model=model,
+            streaming=streaming,
+            chunked=chunked,
+            chrome_trace=True,
+            resume=resume,
+            report_format=report_format
+        )
+        st.session_state.job_id = job.id
+
+
+@st.fragment(run_every=1)
+def show_job_progress(job_id):
+    """Polls the submitted job without blocking the session, and shows the report once it is done."""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        st.session_state.job_id = None
+        st.warning("The job is no longer available. Please generate the report again.")
+        return
+
+    if not job.finished:
+        if job.started_at:
+            label = "Your research agent is at work..."
+        else:
+            label = f"Waiting for a free worker ({get_job_queue().stats()['queued']} jobs queued)..."
+        with st.status(label, expanded=True):
+            for message in job.messages():
+                st.write(message)
+        return
+
+    st.session_state.job_id = None
+    if job.status == DONE:
+        final_state = job.result
+        st.session_state.report_bytes = final_state.get('document_bytes')
+        st.session_state.report_name = final_state.get('document_name', 'research_report.docx')
+        st.session_state.report_mime = REPORT_WRITERS[job.run_args["report_format"]].mime
+        st.session_state.report_generated = True
+        st.session_state.final_state = final_state
+        st.session_state.job_duration = job.finished_at - job.submitted_at
+    else:
+        st.session_state.job_error = job.error
+    st.rerun(scope="app")
 
-                end_time = time.time()
-                duration = end_time - start_time
 
-                st.session_state.report_bytes = final_state.get('document_bytes')
-                st.session_state.report_name = final_state.get('document_name', 'research_report.docx')
-                st.session_state.report_generated = True
-                st.session_state.final_state = final_state
+if st.session_state.get('job_id'):
+    show_job_progress(st.session_state.job_id)
 
-                st.success(f"Report generated successfully in {duration:.2f} seconds!")
+if st.session_state.get('job_error'):
+    st.error(f"An error occurred: {st.session_state.pop('job_error')}")
 
-            except Exception as e:
-                status.update(label=f"An error occurred: {e}", state="error", expanded=True)
-                st.session_state.report_generated = False
+if st.session_state.get('job_duration'):
+    st.success(f"Report generated successfully in {st.session_state.pop('job_duration'):.2f} seconds!")
 
 if st.session_state.get('report_generated', False):
 
@@ -120,14 +180,48 @@ if st.session_state.get('report_generated', False):
                     st.markdown(f"### {publication}")
                     for title, details in articles.items():
                         st.markdown(f"**{title}**")
-                        st.markdown(f"> {details['summary']}")
-                        st.markdown(f"_[Source]({details['link']})_")
+                        if isinstance(details, str):
+                            st.markdown(f"> {details}")
+                        else:
+                            st.markdown(f"> {details['summary']}")
+                            st.markdown(f"_[Source]({details['link']})_")
                         st.divider()
 
+    if st.session_state.final_state and st.session_state.final_state.get("stage_breakdown"):
+        with st.expander("View Performance Breakdown", expanded=False):
+            st.caption("Time spent per stage. Stages run concurrently, so totals can exceed the overall run time.")
+            st.table([
+                {
+                    "Stage": row["stage"],
+                    "Count": row["count"],
+                    "Total (s)": round(row["total_s"], 2),
+                    "Mean (s)": round(row["mean_s"], 3),
+                    "Max (s)": round(row["max_s"], 3)
+                }
+                for row in st.session_state.final_state["stage_breakdown"]
+            ])
+            if st.session_state.final_state.get("site_stats"):
+                st.caption("Articles, failures and throughput per source.")
+                st.table(st.session_state.final_state["site_stats"])
+            st.json(st.session_state.final_state["trace"]["counters"])
+            if st.session_state.final_state.get("site_latency"):
+                st.caption("Page and element wait latencies per site, with the adaptive timeout currently in use.")
+                st.table([
+                    {"Site": site, "Phase": phase, **stats}
+                    for site, phases in st.session_state.final_state["site_latency"].items()
+                    for phase, stats in phases.items()
+                ])
+            st.download_button(
+                label="Download Trace (Chrome/Perfetto)",
+                data=json.dumps(st.session_state.final_state["chrome_trace"]),
+                file_name="research_agent_trace.json",
+                mime="application/json"
+            )
+
     st.download_button(
-        label="Download Word Report",
+        label="Download Report",
         data=st.session_state.report_bytes,
         file_name=st.session_state.report_name,
-        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        mime=st.session_state.get('report_mime', REPORT_WRITERS["docx"].mime),
         use_container_width=True
     )
@@ -0,0 +1,111 @@
+"""
+Headless batch mode: runs many research prompts through the graph in one process.
+
+Queries are read from a text file, one per line (blank lines and lines starting
+with "#" are skipped). Up to --concurrency queries run at the same time and
+share the driver pool, caches, rate limits and LLM clients of the process, so
+browsers are started and models created once per batch rather than per query.
+Each report is written to the output directory as its summaries arrive, in the
+chosen format (docx, markdown, html or jsonl), along with batch_summary.json.
+
+Usage:
+    python batch.py queries.txt --websites IEEE MDPI --pages 1 --depth 3 --output-dir reports
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from langchain_core.messages import HumanMessage
+from progress import LogSink
+from summarization import LIMITS
+from report_writers import REPORT_WRITERS
+from sites import source_names
+from supervisor_agent import run_graph
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import config
+
+
+def read_queries(path):
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def run_query(index, query, args):
+    """Runs one query and writes its report. Returns the entry for batch_summary.json."""
+    logger = logging.getLogger(f"research_agent.query{index}")
+    logger.info(f"Starting: {query}")
+    start = time.time()
+    final_state = run_graph(
+        prompt=[HumanMessage(content=query)],
+        summarization_depth=args.summarization_depth,
+        pages_to_search=args.pages,
+        page_depth=args.depth,
+        websites_to_search=args.websites,
+        model=args.model,
+        status_ui=LogSink(logger),
+        streaming=args.streaming,
+        chunked=args.chunked,
+        resume=not args.no_resume,
+        report_format=args.format,
+        report_dir=args.output_dir
+    )
+    path = final_state["document_path"]
+
+    articles = sum(len(entries) for entries in final_state.get("summarized_articles", {}).values())
+    duration = time.time() - start
+    logger.info(f"Finished in {duration:.1f}s: {path}")
+    return {
+        "query": query,
+        "status": "done",
+        "report": path,
+        "articles": articles,
+        "duration_s": round(duration, 2),
+        "counters": final_state["trace"]["counters"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("queries", help="text file with one research prompt per line")
+    parser.add_argument("--websites", nargs="+", default=["IEEE"], choices=source_names())
+    parser.add_argument("--pages", type=int, default=1, help="pages of search results per website")
+    parser.add_argument("--depth", type=int, default=3, help="articles to scrape per page")
+    parser.add_argument("--summarization-depth", default="Moderate", choices=list(LIMITS))
+    parser.add_argument("--model", default="gemini-2.5-flash")
+    parser.add_argument("--streaming", action="store_true", help="summarize articles while scraping")
+    parser.add_argument("--chunked", action="store_true", help="summarize long articles chunk by chunk")
+    parser.add_argument("--no-resume", action="store_true", help="ignore stored progress of earlier runs")
+    parser.add_argument("--concurrency", type=int, default=config.BATCH_CONCURRENCY, help="queries run at the same time")
+    parser.add_argument("--output-dir", default="reports")
+    parser.add_argument("--format", default="docx", choices=list(REPORT_WRITERS), help="report format")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    queries = read_queries(args.queries)
+    if not queries:
+        parser.error(f"No queries found in {args.queries}.")
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    results = [None] * len(queries)
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency), thread_name_prefix="query") as executor:
+        futures = {executor.submit(run_query, index, query, args): index for index, query in enumerate(queries)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                logging.getLogger(f"research_agent.query{index}").error(f"Failed: {e}")
+                results[index] = {"query": queries[index], "status": "failed", "error": str(e)}
+
+    with open(os.path.join(args.output_dir, "batch_summary.json"), "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    failed = sum(result["status"] == "failed" for result in results)
+    print(f"{len(queries) - failed}/{len(queries)} reports written to {args.output_dir}.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
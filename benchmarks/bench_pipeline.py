@@ -0,0 +1,300 @@
+"""
+Offline throughput benchmark for the scraping, summarization and report stages.
+
+Recorded search result and article pages (benchmarks/fixtures) are replayed from
+a local HTTP server through the IEEE, Springer and MDPI site definitions, the
+articles are summarized by a deterministic fake chat model with configurable
+latency and no rate limits, and the report writers of every output format are timed on a large report.
+Every scenario runs in a fresh Python process, so its peak RSS is its own.
+No request leaves the machine, but search result pages are still rendered by
+headless Chrome, so Chrome must be installed.
+
+Usage:
+    python benchmarks/bench_pipeline.py --pages 1 2 --depth 3 10 --sites 1 3 --llm-latency 0.5
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import urlsplit, parse_qs
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+import config
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+RESULTS_PER_PAGE = 10
+SITES = ["IEEE", "Springer", "MDPI"]
+PAGE_PARAM = {"ieee": "pageNumber", "springer": "page", "mdpi": "page_no"}
+PARAGRAPH = {"ieee": "<p>$text</p>", "springer": "<p>$text</p>", "mdpi": '<div class="html-p">$text</div>'}
+WORDS = ("model data learning network method results system performance analysis approach "
+         "training evaluation proposed framework accuracy dataset features research").split()
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return Template(f.read())
+
+
+def lorem(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves the recorded pages of every site under /ieee, /springer and /mdpi."""
+    paragraphs = 40
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        parts = urlsplit(self.path)
+        segments = parts.path.strip("/").split("/")
+        site = segments[0]
+        if site not in PAGE_PARAM:
+            self.send_error(404)
+            return
+
+        if "article" in segments:
+            body = self.article_page(site, segments[-1])
+        else:
+            page = int(parse_qs(parts.query).get(PAGE_PARAM[site], ["1"])[0])
+            body = self.search_page(site, page)
+
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def search_page(self, site, page):
+        result = load_fixture(f"{site}_result.html")
+        rng = random.Random(f"{site}-{page}")
+        results = "\n".join(
+            result.substitute(
+                link=f"/{site}/article/{page}-{index}",
+                title=f"{site.upper()} paper {page}-{index}",
+                abstract=lorem(rng, 30)
+            )
+            for index in range(RESULTS_PER_PAGE)
+        )
+        return load_fixture(f"{site}_search.html").substitute(results=results)
+
+    def article_page(self, site, article_id):
+        rng = random.Random(f"{site}-{article_id}")
+        paragraph = Template(PARAGRAPH[site])
+        paragraphs = "\n".join(paragraph.substitute(text=lorem(rng, 120)) for _ in range(self.paragraphs))
+        return load_fixture(f"{site}_article.html").substitute(
+            title=f"{site.upper()} paper {article_id}",
+            abstract=lorem(rng, 60),
+            paragraphs=paragraphs
+        )
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSummaryModel(FakeListChatModel):
+    """Chat model that sleeps for `latency` seconds and returns a fixed JSON summary."""
+    latency: float = 0.0
+
+    def invoke(self, *args, **kwargs):
+        time.sleep(self.latency)
+        return super().invoke(*args, **kwargs)
+
+
+def start_server(paragraphs, latency):
+    FixtureHandler.paragraphs = paragraphs
+    FixtureHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def use_server(base, article_workers):
+    """Points every site at the fixture server at `base`, without throttling it like a real site."""
+    config.SITE_BASE_URLS.update({site: f"{base}/{site.lower()}" for site in SITES})
+    config.DOMAIN_POLITENESS[urlsplit(base).netloc] = (max(article_workers, 1) * len(SITES), 0.0)
+
+
+def use_fake_llm():
+    """Lifts the LLM rate limits, which would otherwise time limiter sleeps instead of the fake model."""
+    config.LLM_REQUESTS_PER_MINUTE = config.LLM_TOKENS_PER_MINUTE = 0
+    config.LLM_MAX_IN_FLIGHT = max(config.LLM_MAX_IN_FLIGHT, config.LLM_CONCURRENCY)
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_scenario(pages, depth, site_count, llm_latency, article_workers, base_url, cache_dir):
+    config.CACHE_DIR = cache_dir
+    use_server(base_url, article_workers)
+    use_fake_llm()
+    from scraper import scrape_sites
+    from summarization import LIMITS, summarize_articles
+    from create_report import build_document
+    from cache import get_article_cache, get_summary_cache
+    from instrumentation import Tracer, use_tracer
+    from progress import ProgressBus
+
+    get_article_cache().clear()
+    get_summary_cache().clear()
+
+    tracer = Tracer()
+    llm = FakeSummaryModel(responses=[json.dumps({"summary": "A deterministic benchmark summary."})], latency=llm_latency)
+
+    with use_tracer(tracer):
+        start = time.perf_counter()
+        scraped, _ = scrape_sites(SITES[:site_count], "machine learning", pages, depth, ProgressBus(),
+                                  article_workers=article_workers, max_chars=LIMITS["Moderate"])
+        scraped_at = time.perf_counter()
+        summarized, _ = summarize_articles(scraped, llm, "fake-model", "Moderate", ProgressBus())
+        summarized_at = time.perf_counter()
+        build_document("machine learning", summarized)
+        finished_at = time.perf_counter()
+
+    spans = tracer.to_dict()["spans"]
+    article_latencies = [s["duration"] for s in spans if s["category"] == "article"]
+    llm_latencies = [s["duration"] for s in spans if s["category"] == "llm_call"]
+    articles = sum(len(site_articles) for site_articles in scraped.values())
+    total = finished_at - start
+    return {
+        "pages": pages,
+        "depth": depth,
+        "sites": site_count,
+        "articles": articles,
+        "scrape_s": round(scraped_at - start, 3),
+        "summarize_s": round(summarized_at - scraped_at, 3),
+        "report_s": round(finished_at - summarized_at, 3),
+        "articles_per_s": round(articles / total, 2) if total else 0.0,
+        "article_p50_s": round(percentile(article_latencies, 0.5), 3),
+        "article_p95_s": round(percentile(article_latencies, 0.95), 3),
+        "llm_p50_s": round(percentile(llm_latencies, 0.5), 3),
+        "llm_p95_s": round(percentile(llm_latencies, 0.95), 3),
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+
+
+def bench_create_document(articles_per_site, report_format):
+    """Times the report build alone on a synthetic report with three sites."""
+    from report_writers import write_report
+
+    rng = random.Random(0)
+    summarized = {
+        site: {
+            f"{site} paper {index}": {"link": f"https://example.org/{site}/{index}", "summary": lorem(rng, 250)}
+            for index in range(articles_per_site)
+        }
+        for site in SITES
+    }
+    with tempfile.TemporaryFile() as stream:
+        start = time.perf_counter()
+        write_report("machine learning", summarized, stream, report_format)
+        elapsed = time.perf_counter() - start
+        size = stream.tell()
+    return {
+        "format": report_format,
+        "report_articles": articles_per_site * len(SITES),
+        "build_s": round(elapsed, 3),
+        "report_kb": round(size / 1024, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+
+
+BENCHMARKS = {
+    "scenario": run_scenario,
+    "create_document": bench_create_document
+}
+
+
+def run_isolated(benchmark, **kwargs):
+    """
+    Runs one benchmark in a fresh interpreter and returns its row. ru_maxrss is a
+    high-water mark, so within one process every scenario after the largest would
+    report the same peak RSS.
+    """
+    spec = json.dumps({"benchmark": benchmark, "kwargs": kwargs})
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--isolated", spec], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{benchmark} {kwargs} failed:\n{result.stderr.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def print_table(rows):
+    if not rows:
+        return
+    columns = list(rows[0])
+    widths = [max(len(column), *(len(str(row[column])) for row in rows)) for column in columns]
+    print("  ".join(column.rjust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[column]).rjust(width) for column, width in zip(columns, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1], help="pages_to_search values")
+    parser.add_argument("--depth", type=int, nargs="+", default=[3], help="page_depth values")
+    parser.add_argument("--sites", type=int, nargs="+", default=[1, 3], help="number of sites scraped")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="seconds per fake LLM call")
+    parser.add_argument("--page-latency", type=float, default=0.05, help="seconds added to every served page")
+    parser.add_argument("--paragraphs", type=int, default=40, help="paragraphs per article page")
+    parser.add_argument("--article-workers", type=int, default=config.ARTICLE_WORKERS)
+    parser.add_argument("--report-articles", type=int, nargs="+", default=[100, 1000],
+                        help="articles per site in the create_document benchmark")
+    parser.add_argument("--report-formats", nargs="+", default=["docx", "markdown", "html", "jsonl"],
+                        help="report formats in the create_document benchmark")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--isolated", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.isolated:
+        spec = json.loads(args.isolated)
+        print(json.dumps(BENCHMARKS[spec["benchmark"]](**spec["kwargs"])))
+        return
+
+    cache_dir = tempfile.mkdtemp(prefix="research-agent-bench-")
+    server, base_url = start_server(args.paragraphs, args.page_latency)
+
+    try:
+        pipeline_rows = [
+            run_isolated("scenario", pages=pages, depth=depth, site_count=sites, llm_latency=args.llm_latency,
+                         article_workers=args.article_workers, base_url=base_url, cache_dir=cache_dir)
+            for sites in args.sites
+            for pages in args.pages
+            for depth in args.depth
+        ]
+        report_rows = [
+            run_isolated("create_document", articles_per_site=n, report_format=report_format)
+            for n in args.report_articles
+            for report_format in args.report_formats
+        ]
+    finally:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps({"pipeline": pipeline_rows, "create_document": report_rows}, indent=2))
+    else:
+        print_table(pipeline_rows)
+        print()
+        print_table(report_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Import-time benchmark for the cold start of the app and the graph.
+
+Every measurement runs in a fresh Python process, so nothing is already in
+sys.modules: the time to import the modules the Streamlit script needs, the
+node modules, and to build the compiled graph. The Streamlit app itself is run
+headless with streamlit.testing: its first run (a cold start) and its reruns,
+which happen on every widget change. The heavy dependencies each target pulls
+in are listed, so a module-level import of one of them shows up at once.
+
+Usage:
+    python benchmarks/bench_startup.py --repeat 5 --reruns 10 --max-app-import 1.0 --max-rerun 0.2
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from bench_pipeline import print_table
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What is timed in a fresh interpreter per target.
+TARGETS = {
+    "app_imports": "import streamlit, jobs, report_writers, sites",
+    "supervisor_agent": "import supervisor_agent",
+    "graph": "import supervisor_agent; supervisor_agent.get_graph()",
+    "scraper": "import scraper",
+    "summarization": "import summarization",
+    "create_llm": "import summarization; summarization.create_llm('gemini-2.5-flash')"
+}
+
+# Dependencies that should only be imported once a run needs them.
+HEAVY_MODULES = ["langgraph", "langchain_google_genai", "langchain_core", "docx", "selenium.webdriver.support.ui", "lxml.html"]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+APP_SCRIPT = """
+import json, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("app.py", default_timeout=120)
+start = time.perf_counter()
+app.run()
+first_run = time.perf_counter() - start
+reruns = []
+for _ in range({reruns}):
+    start = time.perf_counter()
+    app.run()
+    reruns.append(time.perf_counter() - start)
+print(json.dumps({{"first_run": first_run, "reruns": reruns}}))
+"""
+
+
+def run_python(script):
+    env = dict(os.environ, GEMINI_API_KEY=os.getenv("GEMINI_API_KEY", "benchmark"))
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_import(name, statement, repeat):
+    samples = [run_python(IMPORT_SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)) for _ in range(repeat)]
+    seconds = [sample["seconds"] for sample in samples]
+    return {
+        "target": name,
+        "median_s": round(statistics.median(seconds), 3),
+        "max_s": round(max(seconds), 3),
+        "heavy_modules": " ".join(samples[-1]["heavy"]) or "-"
+    }
+
+
+def bench_app(reruns):
+    result = run_python(APP_SCRIPT.format(reruns=reruns))
+    return {
+        "first_run_s": round(result["first_run"], 3),
+        "rerun_median_s": round(statistics.median(result["reruns"]), 3) if result["reruns"] else 0.0,
+        "rerun_max_s": round(max(result["reruns"]), 3) if result["reruns"] else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS), choices=list(TARGETS), help="import targets to time")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes per import target")
+    parser.add_argument("--reruns", type=int, default=10, help="Streamlit reruns timed after the first run")
+    parser.add_argument("--no-app", action="store_true", help="skip running the Streamlit app")
+    parser.add_argument("--max-app-import", type=float, help="fail when importing the app's modules takes longer (seconds)")
+    parser.add_argument("--max-rerun", type=float, help="fail when the median Streamlit rerun takes longer (seconds)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    import_rows = []
+    for name in args.targets:
+        try:
+            import_rows.append(bench_import(name, TARGETS[name], max(1, args.repeat)))
+        except RuntimeError as e:
+            print(f"Skipping {name}: {e}", file=sys.stderr)
+    app_row = None if args.no_app else bench_app(args.reruns)
+
+    if args.json:
+        print(json.dumps({"imports": import_rows, "app": app_row}, indent=2))
+    else:
+        print_table(import_rows)
+        if app_row:
+            print()
+            print_table([app_row])
+
+    failures = []
+    app_import = next((row for row in import_rows if row["target"] == "app_imports"), None)
+    if args.max_app_import is not None and app_import and app_import["median_s"] > args.max_app_import:
+        failures.append(f"app imports took {app_import['median_s']}s (limit {args.max_app_import}s)")
+    if args.max_rerun is not None and app_row and app_row["rerun_median_s"] > args.max_rerun:
+        failures.append(f"Streamlit reruns took {app_row['rerun_median_s']}s (limit {args.max_rerun}s)")
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
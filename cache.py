@@ -0,0 +1,151 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from singletons import process_singleton
+import config
+
+
+def normalize_url(url):
+    """
+    Normalizes an article URL so that trivially different links share a cache key.
+
+    The scheme and host are lower-cased, http is treated as https, default ports,
+    fragments, tracking parameters and trailing slashes are dropped, and the
+    remaining query parameters are sorted.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters for one run."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+class SQLiteCache:
+    """
+    A persistent key/value store for JSON-serializable values.
+
+    Values are zlib-compressed in a single SQLite table. Entries older than `ttl`
+    seconds are treated as missing, and the least recently used entries are
+    evicted once the stored size exceeds `max_bytes`.
+    """
+    def __init__(self, path, ttl, max_bytes):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._conn.commit()
+
+    def get(self, key):
+        """Returns the value stored under `key`, or None if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self.ttl and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, key, value):
+        blob = zlib.compress(json.dumps(value).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        if self.ttl:
+            self._conn.execute("DELETE FROM entries WHERE created < ?", (now - self.ttl,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+
+@process_singleton
+def get_article_cache():
+    """Returns the process-wide cache of scraped articles, keyed by normalized URL."""
+    return SQLiteCache(
+        os.path.join(config.CACHE_DIR, "articles.sqlite3"),
+        ttl=config.ARTICLE_CACHE_TTL,
+        max_bytes=config.ARTICLE_CACHE_MAX_MB * 1024 * 1024
+    )
+
+
+@process_singleton
+def get_summary_cache():
+    """Returns the process-wide cache of LLM summaries, keyed by summary_cache_key."""
+    return SQLiteCache(
+        os.path.join(config.CACHE_DIR, "summaries.sqlite3"),
+        ttl=config.SUMMARY_CACHE_TTL,
+        max_bytes=config.SUMMARY_CACHE_MAX_MB * 1024 * 1024
+    )
+
+
+def summary_cache_key(content, prompt_template, model):
+    """Hashes everything that determines a summary: the content sent, the prompt and the model."""
+    digest = hashlib.sha256()
+    for part in (model, prompt_template, content):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,66 @@
+import re
+
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def count_tokens(text):
+    """
+    Approximates the number of LLM tokens in `text` by counting words and punctuation.
+
+    Good enough for sizing chunks without a tokenizer round trip to the API.
+    """
+    return len(_TOKEN.findall(text))
+
+
+def _split_oversized(text, max_tokens, count):
+    """Splits a paragraph larger than `max_tokens` on sentences, then on words."""
+    pieces = []
+    for sentence in _SENTENCE_END.split(text):
+        if count(sentence) <= max_tokens:
+            pieces.append(sentence)
+            continue
+        words = sentence.split()
+        step = max(1, max_tokens // 2)
+        pieces.extend(" ".join(words[i:i + step]) for i in range(0, len(words), step))
+    return pieces
+
+
+def split_into_chunks(text, max_tokens, count=count_tokens):
+    """
+    Splits `text` into chunks of at most about `max_tokens` tokens.
+
+    Chunks are packed from whole paragraphs (separated by blank lines). Only a
+    paragraph that is larger than a chunk on its own is split further, on
+    sentence and then word boundaries.
+
+    Args:
+        text (str): The article text.
+        max_tokens (int): The token budget of a chunk.
+        count (callable): Token counter, `count_tokens` by default.
+
+    Returns:
+        list: The chunks, in order.
+    """
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if count(paragraph) > max_tokens:
+            pieces.extend(_split_oversized(paragraph, max_tokens, count))
+        else:
+            pieces.append(paragraph)
+
+    chunks = []
+    current, current_tokens = [], 0
+    for piece in pieces:
+        tokens = count(piece)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
@@ -0,0 +1,93 @@
+import os
+
+# Base URL overrides per site, e.g. to replay recorded pages in benchmarks. The
+# defaults live in the site definitions (sites.py); <NAME>_BASE_URL also overrides one.
+SITE_BASE_URLS = {}
+
+# Number of websites scraped at the same time by scraping_router.
+MAX_CONCURRENT_SITES = int(os.getenv("MAX_CONCURRENT_SITES", "3"))
+
+# Headless Chrome sessions kept by driver_pool. A driver is recycled after
+# DRIVER_MAX_USES checkouts or when it has been idle for DRIVER_IDLE_TIMEOUT seconds.
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "3"))
+DRIVER_MAX_USES = int(os.getenv("DRIVER_MAX_USES", "50"))
+DRIVER_IDLE_TIMEOUT = float(os.getenv("DRIVER_IDLE_TIMEOUT", "600"))
+
+# Browser workers used to open article pages of a single site in parallel.
+ARTICLE_WORKERS = int(os.getenv("ARTICLE_WORKERS", "3"))
+
+# Per-domain politeness: page loads in flight at once and minimum seconds
+# between the start of two loads. DOMAIN_POLITENESS overrides the defaults.
+DOMAIN_MAX_IN_FLIGHT = int(os.getenv("DOMAIN_MAX_IN_FLIGHT", "2"))
+DOMAIN_MIN_INTERVAL = float(os.getenv("DOMAIN_MIN_INTERVAL", "0.5"))
+DOMAIN_POLITENESS = {
+    "www.mdpi.com": (2, 2.0)
+}
+
+# Browser page loads: "eager" stops waiting once the DOM is ready; BLOCK_RESOURCES
+# keeps images, fonts, media and trackers from loading at all.
+PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "eager")
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "1") not in ("0", "false", "False")
+
+# Adaptive waits for page loads and rendered elements, learned per site. Until
+# WAIT_MIN_SAMPLES waits succeeded the timeout is WAIT_INITIAL_TIMEOUT; then it
+# is WAIT_P95_FACTOR times the rolling p95 of the last WAIT_WINDOW waits, clamped
+# to [WAIT_MIN_TIMEOUT, WAIT_MAX_TIMEOUT]. Every consecutive timeout multiplies it
+# by WAIT_BACKOFF_FACTOR, up to WAIT_MAX_TIMEOUT. A wait gives up WAIT_AFTER_LOAD
+# seconds after the page finished loading without the element.
+WAIT_INITIAL_TIMEOUT = float(os.getenv("WAIT_INITIAL_TIMEOUT", "20"))
+WAIT_MIN_TIMEOUT = float(os.getenv("WAIT_MIN_TIMEOUT", "3"))
+WAIT_MAX_TIMEOUT = float(os.getenv("WAIT_MAX_TIMEOUT", "30"))
+WAIT_P95_FACTOR = float(os.getenv("WAIT_P95_FACTOR", "2"))
+WAIT_BACKOFF_FACTOR = float(os.getenv("WAIT_BACKOFF_FACTOR", "2"))
+WAIT_MIN_SAMPLES = int(os.getenv("WAIT_MIN_SAMPLES", "5"))
+WAIT_WINDOW = int(os.getenv("WAIT_WINDOW", "50"))
+WAIT_AFTER_LOAD = float(os.getenv("WAIT_AFTER_LOAD", "5"))
+
+# How article pages are fetched: "auto" reads the static HTML over a pooled HTTP
+# session and only falls back to Chrome when the article container is missing;
+# "selenium" always renders the page in Chrome. SITE_FETCH_MODES overrides per site.
+FETCH_MODE = os.getenv("FETCH_MODE", "auto")
+SITE_FETCH_MODES = {}
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+
+# Directory holding the persistent caches. Scraped articles expire after
+# ARTICLE_CACHE_TTL seconds; least recently used ones are evicted beyond ARTICLE_CACHE_MAX_MB.
+# LLM summaries are kept under the matching SUMMARY_CACHE_* limits.
+CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+ARTICLE_CACHE_TTL = float(os.getenv("ARTICLE_CACHE_TTL", str(7 * 24 * 3600)))
+ARTICLE_CACHE_MAX_MB = float(os.getenv("ARTICLE_CACHE_MAX_MB", "500"))
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", str(30 * 24 * 3600)))
+SUMMARY_CACHE_MAX_MB = float(os.getenv("SUMMARY_CACHE_MAX_MB", "100"))
+
+# Progress of runs is checkpointed to the run store; a rerun with the same
+# settings within RUN_STORE_TTL seconds resumes it instead of starting over.
+RUN_STORE_TTL = float(os.getenv("RUN_STORE_TTL", str(24 * 3600)))
+
+# LLM summarization: calls in flight per run and across all runs, per-model rate
+# limits shared by the whole process (0 disables a limit) and retries on 429/5xx responses.
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "8"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "1000000"))
+LLM_MAX_ATTEMPTS = int(os.getenv("LLM_MAX_ATTEMPTS", "5"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "2"))
+
+# Token budget of one chunk in chunked (map-reduce) summarization.
+CHUNK_TOKENS = int(os.getenv("CHUNK_TOKENS", "3000"))
+
+# Cross-site deduplication: articles whose estimated content similarity (MinHash
+# Jaccard) reaches DEDUP_THRESHOLD are treated as the same paper and summarized once.
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.8"))
+
+# Job queue behind the web UI: graph runs executed at the same time, and seconds
+# a finished job (with its report) is kept for the session that submitted it.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_RETENTION = float(os.getenv("JOB_RETENTION", "3600"))
+
+# Seconds between two deliveries of queued progress events to the UI or log.
+PROGRESS_FLUSH_INTERVAL = float(os.getenv("PROGRESS_FLUSH_INTERVAL", "0.5"))
+
+# Queries of a batch.py run processed at the same time.
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "2"))
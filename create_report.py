@@ -1,44 +1,51 @@
-from docx import Document
-from datetime import datetime
 from overall_state import OverallState
+from instrumentation import count, span
+from progress import get_progress
+from report_writers import get_report_writer, report_file_name, write_report
 import io
+import os
 
 def create_document(state: OverallState) -> dict:
     """
-    Node for creating the final Word document and returning it as a byte stream.
-    This avoids saving the file to disk on the server.
+    Node for creating the final report in the run's report format (Word by default).
+
+    When the run writes its report to a file, the summaries that were not added
+    while they arrived are appended and the file is finished; the state then
+    carries "document_path". Otherwise the report is built in memory and
+    returned as "document_bytes", without saving it on the server.
     """
-    ui_container = state.get("ui_container")
+    progress = get_progress(state.get("run_id"))
     summarized_dict = state["summarized_articles"]
     query = state["messages"][-1].content
-    ui_container.write("- Creating analysis report...")
-
-    doc = Document()
-    doc.add_heading(f'Research Analysis: {query}', 0)
-    doc.add_paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    doc.add_paragraph("")
+    report_format = state.get("report_format") or "docx"
+    progress.write("- Creating analysis report...")
 
-    for publication, summary_dict in summarized_dict.items():
-        if summary_dict:
-            doc.add_heading(publication, level=1)
-            doc.add_paragraph("")
-            for title, summarized_article_dict in summary_dict.items():
-                summary = summarized_article_dict.get("summary", "Summary not available.")
-                doc.add_heading(title, level=2)
-                doc.add_paragraph(summary)
-                doc.add_paragraph(f"Source: {summarized_article_dict.get('link', 'Link not available.')}")
-                doc.add_paragraph("")
-
-    safe_query = "".join(c for c in query if c.isalnum() or c in (' ', '_')).rstrip()
-    safe_query = safe_query.replace(' ', '_')
-    file_name = f"research_analysis_{safe_query}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
+    live = get_report_writer(state.get("run_id"))
+    if live is not None:
+        writer, path = live
+        with span(report_format, "build_document"):
+            writer.add_all(summarized_dict)
+            writer.finish()
+        count("report_bytes", os.path.getsize(path))
+        return {
+            "document_path": path,
+            "document_name": os.path.basename(path)
+        }
 
     doc_io = io.BytesIO()
-    doc.save(doc_io)
-    doc_io.seek(0)
+    with span(report_format, "build_document"):
+        write_report(query, summarized_dict, doc_io, report_format)
+    count("report_bytes", doc_io.getbuffer().nbytes)
 
     return {
         "document_bytes": doc_io.getvalue(),
-        "document_name": file_name
+        "document_name": report_file_name(query, report_format)
     }
 
+
+def build_document(query, summarized_dict):
+    """Builds the Word report and returns it saved into a BytesIO."""
+    doc_io = io.BytesIO()
+    write_report(query, summarized_dict, doc_io, "docx")
+    doc_io.seek(0)
+    return doc_io
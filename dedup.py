@@ -0,0 +1,157 @@
+from overall_state import OverallState
+from cache import normalize_url
+from instrumentation import span
+from progress import get_progress
+import hashlib
+import random
+import re
+import threading
+import config
+
+_DOI = re.compile(r"10\.\d{4,9}/[^\s?#&\"'<>]+", re.IGNORECASE)
+_WORD = re.compile(r"\w+")
+
+
+def extract_doi(link):
+    """Returns the DOI embedded in an article URL (e.g. Springer links), lower-cased, or None."""
+    match = _DOI.search(link)
+    return match.group(0).rstrip("./").lower() if match else None
+
+
+def identity_key(link):
+    """The DOI of an article when its URL carries one, otherwise its normalized URL."""
+    doi = extract_doi(link)
+    return f"doi:{doi}" if doi else f"url:{normalize_url(link)}"
+
+
+def shingles(content, size, max_words):
+    """Hashed word `size`-grams of the first `max_words` words of `content`."""
+    words = _WORD.findall(content.lower())[:max_words]
+    if len(words) < size:
+        return {_hash(" ".join(words))} if words else set()
+    return {_hash(" ".join(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+def _hash(text):
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class DedupIndex:
+    """
+    Finds articles that were already seen in the same run.
+
+    An article is a duplicate when its DOI or normalized URL matches an earlier
+    one, or when its content is nearly identical: MinHash signatures of word
+    shingles are bucketed with locality-sensitive hashing, and candidates whose
+    estimated Jaccard similarity reaches `threshold` count as the same paper.
+    """
+    def __init__(self, threshold=None, num_perm=64, bands=16, shingle_size=5, max_words=3000):
+        self.threshold = config.DEDUP_THRESHOLD if threshold is None else threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_words = max_words
+        rng = random.Random(1)
+        self._masks = [rng.getrandbits(64) for _ in range(num_perm)]
+        self._lock = threading.Lock()
+        self._identities = {}
+        self._signatures = {}
+        self._buckets = {}
+        self._results = {}
+
+    def signature(self, content):
+        """MinHash signature of `content`; each hash function XORs the shingle hashes with its own random mask."""
+        hashes = shingles(content, self.shingle_size, self.max_words)
+        if not hashes:
+            return None
+        return tuple(min(h ^ mask for h in hashes) for mask in self._masks)
+
+    def add(self, key, link, content):
+        """
+        Registers an article under `key` (e.g. (website, link)).
+
+        Returns:
+            tuple | None: The key of the earlier article it duplicates, and the reason
+            ("url" or "content"); None when the article is new. Adding the same key
+            again returns the first answer.
+        """
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+        result = self._add(key, identity_key(link), self.signature(content))
+        with self._lock:
+            return self._results.setdefault(key, result)
+
+    def _add(self, key, identity, signature):
+        with self._lock:
+            first = self._identities.setdefault(identity, key)
+            if first != key:
+                return first, "url"
+            if signature is None:
+                return None
+
+            candidates = set()
+            band_keys = []
+            for band in range(self.bands):
+                band_key = (band, signature[band * self.rows:(band + 1) * self.rows])
+                band_keys.append(band_key)
+                candidates.update(self._buckets.get(band_key, ()))
+            for candidate in candidates:
+                other = self._signatures[candidate]
+                similarity = sum(x == y for x, y in zip(signature, other)) / len(signature)
+                if similarity >= self.threshold:
+                    return candidate, "content"
+
+            self._signatures[key] = signature
+            for band_key in band_keys:
+                self._buckets.setdefault(band_key, []).append(key)
+            return None
+
+
+def deduplicate(scraped_articles, index=None):
+    """
+    Drops articles that duplicate an earlier one, within and across websites.
+
+    Args:
+        scraped_articles (dict): Scraped articles per website.
+        index (DedupIndex, optional): Index that already holds articles seen while
+            streaming; a new one is used otherwise.
+
+    Returns:
+        tuple: The scraped articles without duplicates (same shape) and the
+        deduplication statistics, including the LLM calls avoided.
+    """
+    index = index or DedupIndex()
+    unique = {}
+    by_url = by_content = 0
+    for website, articles in scraped_articles.items():
+        unique[website] = {}
+        for title, article in articles.items():
+            duplicate = index.add((website, article["link"]), article["link"], article["content"])
+            if duplicate is None:
+                unique[website][title] = article
+                continue
+            if duplicate[1] == "url":
+                by_url += 1
+            else:
+                by_content += 1
+
+    total = by_url + by_content
+    return unique, {
+        "duplicates": total,
+        "duplicates_by_url": by_url,
+        "duplicates_by_content": by_content,
+        "llm_calls_avoided": total
+    }
+
+
+def deduplicate_articles_node(state: OverallState) -> dict:
+    """Node for removing duplicate papers between scraping and summarization."""
+    progress = get_progress(state.get("run_id"))
+    with span("deduplicate", "dedup"):
+        unique, dedup_stats = deduplicate(state["scraped_articles"])
+    progress.write(
+        f"- Removed {dedup_stats['duplicates']} duplicate articles "
+        f"({dedup_stats['llm_calls_avoided']} LLM calls avoided)."
+    )
+    return {"scraped_articles": unique, "dedup_stats": dedup_stats}
@@ -0,0 +1,175 @@
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from contextlib import contextmanager
+import atexit
+import threading
+import time
+from instrumentation import span
+from singletons import process_singleton
+import config
+
+# Requests blocked in every browser when BLOCK_RESOURCES is on: fonts, media and
+# common analytics/ad trackers, none of which carry article text.
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*hotjar.com*", "*scorecardresearch.com*", "*newrelic.com*", "*nr-data.net*",
+    "*adobedtm.com*", "*omtrdc.net*", "*demdex.net*", "*crazyegg.com*", "*qualtrics.com*"
+]
+
+
+def build_chrome_options():
+    """Returns the headless Chrome options shared by every scraper."""
+    options = webdriver.ChromeOptions()
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    # "eager" returns from driver.get() once the DOM is parsed instead of waiting for every subresource.
+    options.page_load_strategy = config.PAGE_LOAD_STRATEGY
+    if config.BLOCK_RESOURCES:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return options
+
+
+class DriverPool:
+    """
+    A bounded pool of warm headless Chrome sessions.
+
+    Drivers are checked out with `driver()` and handed back when the block exits.
+    At most `max_size` browsers are alive at once; idle drivers are health-checked
+    before reuse and recycled once they crash, sit idle too long or reach `max_uses`.
+    """
+    def __init__(self, max_size=config.DRIVER_POOL_SIZE, max_uses=config.DRIVER_MAX_USES,
+                 idle_timeout=config.DRIVER_IDLE_TIMEOUT):
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._uses = {}
+        self.created = 0
+        self.recycled = 0
+
+    def _create(self):
+        with span("chrome", "browser_start"):
+            driver = webdriver.Chrome(options=build_chrome_options())
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if config.BLOCK_RESOURCES:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        with self._lock:
+            self._uses[driver] = 0
+            self.created += 1
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+            self.recycled += 1
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Could not quit browser session. Error: {e}")
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(driver):
+        """Closes tabs leaked by the previous borrower and returns to a blank page."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get("about:blank")
+
+    def acquire(self, timeout=None):
+        """Checks out a healthy driver, launching a new browser if none are idle."""
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No browser session became available in time.")
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+                    driver, last_used = self._idle.pop()
+                if time.monotonic() - last_used < self.idle_timeout and self._is_healthy(driver):
+                    return driver
+                self._discard(driver)
+            return self._create()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver, discard=False):
+        """Returns a driver to the pool, or quits it if it is broken or worn out."""
+        try:
+            with self._lock:
+                self._uses[driver] = self._uses.get(driver, 0) + 1
+                worn_out = self._uses[driver] >= self.max_uses
+            if not discard and not worn_out and self._is_healthy(driver):
+                try:
+                    self._reset(driver)
+                except WebDriverException:
+                    discard = True
+            else:
+                discard = True
+
+            if discard:
+                self._discard(driver)
+            else:
+                with self._lock:
+                    self._idle.append((driver, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager that checks a driver out and always hands it back."""
+        driver = self.acquire(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def shutdown(self):
+        """Quits every idle browser, e.g. when the server process exits."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver, _ in idle:
+            self._discard(driver)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "live": len(self._uses),
+                "idle": len(self._idle),
+                "created": self.created,
+                "recycled": self.recycled
+            }
+
+
+@process_singleton
+def get_driver_pool():
+    """
+    Returns the process-wide driver pool.
+
+    The pool lives at module level so warm browsers survive Streamlit reruns
+    within the same server process.
+    """
+    pool = DriverPool()
+    atexit.register(pool.shutdown)
+    return pool
@@ -0,0 +1,68 @@
+from requests.adapters import HTTPAdapter
+import lxml.html
+import requests
+from singletons import process_singleton
+import config
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+@process_singleton
+def get_session():
+    """
+    Returns the process-wide HTTP session.
+
+    The session keeps a pool of keep-alive connections per host, so concurrent
+    article fetches reuse TCP/TLS connections instead of opening new ones.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=config.HTTP_POOL_SIZE, pool_maxsize=config.HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Language": "en-US,en;q=0.9"
+    })
+    return session
+
+
+def download(url):
+    """Downloads a page and returns its raw HTML bytes."""
+    response = get_session().get(url, timeout=config.HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+def parse_article(html, container_class, paragraph_xpath, max_chars=None):
+    """
+    Extracts the title and text of an article from static HTML.
+
+    Args:
+        html (bytes): The page HTML.
+        container_class (str): CSS class of the element holding the article body.
+        paragraph_xpath (str): XPath of the paragraphs, relative to the container.
+        max_chars (int, optional): Paragraphs are collected until the text reaches
+            this many characters; the text is cut there.
+
+    Returns:
+        tuple | None: The page title and article text, or None when the HTML
+        does not contain the article container (e.g. it is rendered by JavaScript).
+    """
+    tree = lxml.html.fromstring(html)
+    containers = tree.find_class(container_class)
+    if not containers:
+        return None
+
+    paragraphs = []
+    size = 0
+    for element in containers[0].xpath(paragraph_xpath):
+        text = " ".join(element.text_content().split())
+        if not text:
+            continue
+        paragraphs.append(text)
+        size += len(text) + 2
+        if max_chars is not None and size >= max_chars:
+            break
+    doc_text = "\n\n".join(paragraphs)[:max_chars]
+    title = " ".join((tree.findtext(".//title") or "").split())
+    return title, doc_text
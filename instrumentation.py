@@ -0,0 +1,150 @@
+from contextlib import contextmanager
+from functools import wraps
+import contextvars
+import threading
+import time
+
+_current_tracer = contextvars.ContextVar("tracer", default=None)
+
+
+class Tracer:
+    """
+    Collects timing spans and counters for one graph run.
+
+    Spans are recorded by `span()` from any thread; the tracer is found through
+    a context variable, so code deep in the scrapers does not need it passed in.
+    Worker threads must be started with `run_in_context` for their spans to be
+    attributed to the run.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self.started_at = time.time()
+        self.spans = []
+        self.counters = {}
+
+    def add_span(self, name, category, start, end, attrs):
+        with self._lock:
+            self.spans.append({
+                "name": name,
+                "category": category,
+                "start": start - self._origin,
+                "duration": end - start,
+                "thread": threading.current_thread().name,
+                "attrs": attrs
+            })
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self):
+        """Returns the trace as plain JSON-serializable data."""
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "spans": list(self.spans),
+                "counters": dict(self.counters)
+            }
+
+    def to_chrome_trace(self):
+        """Returns the spans in the Chrome trace event format, viewable in Perfetto or chrome://tracing."""
+        with self._lock:
+            spans = list(self.spans)
+            counters = dict(self.counters)
+        threads = {}
+        events = []
+        for span in spans:
+            tid = threads.setdefault(span["thread"], len(threads) + 1)
+            events.append({
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6),
+                "dur": round(span["duration"] * 1e6),
+                "pid": 1,
+                "tid": tid,
+                "args": span["attrs"]
+            })
+        for thread, tid in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": thread}})
+        return {"traceEvents": events, "otherData": {"counters": counters}}
+
+    def breakdown(self):
+        """
+        Aggregates spans per category.
+
+        Returns:
+            list: One row per category with the number of spans and their total,
+            mean and max duration in seconds, slowest category first. Spans run
+            concurrently, so totals can exceed the wall-clock time of the run.
+        """
+        with self._lock:
+            spans = list(self.spans)
+        rows = {}
+        for span in spans:
+            row = rows.setdefault(span["category"], {"stage": span["category"], "count": 0, "total_s": 0.0, "max_s": 0.0})
+            row["count"] += 1
+            row["total_s"] += span["duration"]
+            row["max_s"] = max(row["max_s"], span["duration"])
+        for row in rows.values():
+            row["mean_s"] = row["total_s"] / row["count"]
+        return sorted(rows.values(), key=lambda row: row["total_s"], reverse=True)
+
+
+def get_tracer():
+    """Returns the tracer of the current run, or None outside a traced run."""
+    return _current_tracer.get()
+
+
+@contextmanager
+def use_tracer(tracer):
+    """Makes `tracer` the current tracer for the duration of the block."""
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+@contextmanager
+def span(name, category, **attrs):
+    """
+    Times the block as a span of the current run. Does nothing outside a traced run.
+
+    Yields the span's attribute dict, so the block can attach values measured inside it.
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield attrs
+        return
+    start = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        tracer.add_span(name, category, start, time.perf_counter(), attrs)
+
+
+def count(name, amount=1):
+    """Adds `amount` to a counter of the current run."""
+    tracer = _current_tracer.get()
+    if tracer is not None:
+        tracer.count(name, amount)
+
+
+def traced_node(name, node):
+    """Wraps a LangGraph node so that each call is recorded as a "node" span."""
+    @wraps(node)
+    def wrapper(state):
+        with span(name, "node"):
+            return node(state)
+    return wrapper
+
+
+def run_in_context(fn):
+    """
+    Binds `fn` to a copy of the caller's context, so spans recorded on a worker
+    thread or executor still reach the caller's tracer.
+    """
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+from run_store import run_key
+from singletons import process_singleton
+import threading
+import time
+import uuid
+import config
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def job_key(run_args):
+    """Identifies a job by its run_graph arguments; identical in-flight jobs share it."""
+    params = dict(run_args)
+    params["prompt"] = params["prompt"][-1].content
+    params["websites_to_search"] = sorted(params.get("websites_to_search", []))
+    return run_key(params)
+
+
+class Job:
+    """
+    One graph run submitted to the job queue.
+
+    The job stands in for the UI container of the run: progress messages written
+    by the graph are collected on the job, and the UI polls them with `messages`.
+    """
+    def __init__(self, key, run_args):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.run_args = run_args
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._messages = []
+
+    def write(self, message):
+        with self._lock:
+            self._messages.append(str(message))
+
+    def messages(self, start=0):
+        """Returns the progress messages from index `start` on."""
+        with self._lock:
+            return self._messages[start:]
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+
+class JobQueue:
+    """
+    Runs graph runs on a bounded pool of worker threads.
+
+    Submitting returns at once with a Job to poll. A job identical to one that
+    is still queued or running is not run twice: the caller gets the existing
+    job. All workers share the process-wide driver pool, caches and LLM limits,
+    so browsers and LLM calls stay capped however many users submit jobs.
+    """
+    def __init__(self, max_workers, retention):
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._in_flight = {}
+
+    def submit(self, **run_args):
+        """
+        Queues a run_graph call (all arguments except `status_ui`).
+
+        Returns:
+            Job: The new job, or the identical job already in flight.
+        """
+        key = job_key(run_args)
+        with self._lock:
+            self._prune()
+            existing = self._in_flight.get(key)
+            if existing is not None:
+                return existing
+            job = Job(key, run_args)
+            self._jobs[job.id] = job
+            self._in_flight[key] = job
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        """Returns the job with `job_id`, or None once it is unknown or expired."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return {status: sum(job.status == status for job in jobs) for status in (QUEUED, RUNNING, DONE, FAILED)}
+
+    def _run(self, job):
+        from supervisor_agent import run_graph
+
+        job.started_at = time.time()
+        job.status = RUNNING
+        try:
+            job.result = run_graph(status_ui=job, **job.run_args)
+            status = DONE
+        except Exception as e:
+            print(f"Job {job.id} failed. Error: {e}")
+            job.error = str(e)
+            status = FAILED
+        job.finished_at = time.time()
+        job.status = status
+        with self._lock:
+            if self._in_flight.get(job.key) is job:
+                del self._in_flight[job.key]
+
+    def _prune(self):
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and now - job.finished_at > self.retention:
+                del self._jobs[job_id]
+
+
+@process_singleton
+def get_job_queue():
+    """Returns the process-wide job queue shared by every UI session."""
+    return JobQueue(config.JOB_WORKERS, config.JOB_RETENTION)
@@ -0,0 +1,165 @@
+from overall_state import OverallState
+from cache import normalize_url
+from instrumentation import count, span
+from progress import get_progress
+from singletons import process_singleton
+from sites import LOCAL_SOURCE
+import os
+import re
+import sqlite3
+import threading
+import time
+import config
+
+_WORD = re.compile(r"\w+")
+
+# Words of a research prompt that say nothing about its topic.
+STOPWORDS = set("""
+a about across after against all also an analyze analyse analysis and any are as at be been between both but by
+can compare could describe discuss do does effect effects explain find for from give has have how i impact in into
+is it its latest me more most of on or our overview please recent research review role should show some study
+studies summarize survey than that the their them these this those to toward towards under use used using
+versus vs was what when where which while who why will with within without would
+""".split())
+
+
+def match_query(text):
+    """
+    Turns a free-text research prompt into an FTS5 query: its topic words,
+    quoted and OR-ed, so that bm25 ranks papers by how many of them they match.
+    """
+    words = []
+    for word in _WORD.findall(text.lower()):
+        if len(word) > 1 and word not in STOPWORDS and word not in words:
+            words.append(word)
+    return " OR ".join(f'"{word}"' for word in words)
+
+
+class LocalIndex:
+    """
+    Persistent full-text index of every scraped article and its summary.
+
+    Papers are stored once per normalized URL and indexed with SQLite FTS5;
+    searches are ranked with bm25, weighting title matches over summary and
+    body matches. The index is updated after every run, so papers collected by
+    earlier research can be found again without visiting the websites.
+    """
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS papers ("
+            "id INTEGER PRIMARY KEY, url TEXT UNIQUE NOT NULL, link TEXT NOT NULL, website TEXT NOT NULL, "
+            "title TEXT NOT NULL, content TEXT NOT NULL, summary TEXT NOT NULL DEFAULT '', updated REAL NOT NULL);"
+            "CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5("
+            "title, summary, content, content='papers', content_rowid='id', tokenize='porter unicode61');"
+            "CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN "
+            "INSERT INTO papers_fts (rowid, title, summary, content) VALUES (new.id, new.title, new.summary, new.content); END;"
+            "CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN "
+            "INSERT INTO papers_fts (papers_fts, rowid, title, summary, content) "
+            "VALUES ('delete', old.id, old.title, old.summary, old.content); END;"
+            "CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE ON papers BEGIN "
+            "INSERT INTO papers_fts (papers_fts, rowid, title, summary, content) "
+            "VALUES ('delete', old.id, old.title, old.summary, old.content); "
+            "INSERT INTO papers_fts (rowid, title, summary, content) VALUES (new.id, new.title, new.summary, new.content); END;"
+        )
+        self._conn.commit()
+
+    def add(self, scraped_articles, summarized_articles=None):
+        """
+        Adds or updates the papers of a run.
+
+        Args:
+            scraped_articles (dict): Scraped articles per website.
+            summarized_articles (dict, optional): Summary entries per website; only
+                successful summaries are stored.
+
+        Returns:
+            int: The number of papers written.
+        """
+        summarized_articles = summarized_articles or {}
+        now = time.time()
+        rows = []
+        for website, articles in scraped_articles.items():
+            summaries = summarized_articles.get(website) or {}
+            for title, article in articles.items():
+                entry = summaries.get(title)
+                summary = entry.get("summary", "") if isinstance(entry, dict) else ""
+                rows.append((normalize_url(article["link"]), article["link"], website, title, article["content"], summary, now))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO papers (url, link, website, title, content, summary, updated) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET link = excluded.link, website = excluded.website, title = excluded.title, "
+                "content = excluded.content, summary = CASE WHEN excluded.summary != '' THEN excluded.summary ELSE papers.summary END, "
+                "updated = excluded.updated",
+                rows
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def search(self, query, limit=10):
+        """
+        Returns up to `limit` papers matching a free-text query, best match first,
+        as dicts with website, title, link, content, summary and score.
+        """
+        expression = match_query(query)
+        if not expression:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.website, p.title, p.link, p.content, p.summary, bm25(papers_fts, 10.0, 3.0, 1.0) AS score "
+                "FROM papers_fts JOIN papers p ON p.id = papers_fts.rowid "
+                "WHERE papers_fts MATCH ? ORDER BY score LIMIT ?",
+                (expression, limit)
+            ).fetchall()
+        keys = ("website", "title", "link", "content", "summary", "score")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def size(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+
+@process_singleton
+def get_local_index():
+    """Returns the process-wide local paper index."""
+    return LocalIndex(os.path.join(config.CACHE_DIR, "index.sqlite3"))
+
+
+def search_local(query, pages_to_search, page_depth, progress, article_workers=None, cache_stats=None, on_article=None,
+                 max_chars=None, errors=None):
+    """
+    Searches the local index like a website: returns the best `pages_to_search *
+    page_depth` previously collected papers for the query, without any network access.
+    Takes the same arguments as the website scrapers.
+    """
+    with span(query, "local_search"):
+        results = get_local_index().search(query, limit=pages_to_search * page_depth)
+    count("local_hits", len(results))
+
+    local_articles = {}
+    for result in results:
+        title = f"{result['title']} ({result['website']})"
+        content = result["content"][:max_chars]
+        local_articles[title] = {"link": result["link"], "content": content}
+        if on_article:
+            on_article(title, result["link"], content)
+    progress.write(f"- Found {len(local_articles)} articles in the local index...")
+    return local_articles
+
+
+def index_articles_node(state: OverallState) -> dict:
+    """Node for adding the papers of the run to the local index, so later searches can find them."""
+    scraped_articles = {
+        website: articles for website, articles in state.get("scraped_articles", {}).items()
+        if website != LOCAL_SOURCE
+    }
+    with span("index", "local_index"):
+        added = get_local_index().add(scraped_articles, state.get("summarized_articles"))
+    get_progress(state.get("run_id")).write(f"- Added {added} articles to the local index.")
+    return {}
@@ -1,5 +1,4 @@
 from langgraph.graph import MessagesState
-from typing import Any
 
 class OverallState(MessagesState):
     """
@@ -15,5 +14,16 @@ class OverallState(MessagesState):
     model: str
     document_bytes: bytes
     document_name: str
-    ui_container: Any
+    max_concurrent_sites: int
+    article_workers: int
+    article_cache_stats: dict
+    summary_cache_stats: dict
+    llm_concurrency: int
+    streaming: bool
+    chunked_summarization: bool
+    run_key: str
+    run_id: str
+    report_format: str
+    document_path: str
+    dedup_stats: dict
 
@@ -0,0 +1,120 @@
+from overall_state import OverallState
+from scraper import scrape_for_run
+from summarization import Summarizer, create_llm
+from instrumentation import run_in_context
+from run_store import get_run_store
+from dedup import DedupIndex, deduplicate
+from progress import get_progress
+from report_writers import get_report_writer
+import queue
+import threading
+
+
+def scrape_and_summarize_node(state: OverallState) -> dict:
+    """
+    Node for the streaming mode: scrapes and summarizes articles at the same time.
+
+    Every article is queued for summarization as soon as its text is extracted,
+    unless it duplicates one seen earlier in the run, and a pool of summarizer
+    threads consumes the queue while scraping goes on. Returns the same keys as
+    the scrape_articles, deduplicate_articles and summarize_articles nodes.
+    """
+    progress = get_progress(state.get("run_id"))
+    progress.write("Starting streaming scrape and summarization...")
+
+    model = state["model"]
+    summarizer = Summarizer(
+        create_llm(model), model, state.get("summarization_depth", "Moderate"),
+        chunked=state.get("chunked_summarization", False),
+        max_concurrency=state.get("llm_concurrency")
+    )
+
+    key = state.get("run_key")
+    store = get_run_store() if key else None
+    summarizer_progress = progress.source("Summarizer")
+    articles = queue.Queue()
+    index = DedupIndex()
+    summaries = store.summaries(key) if store else {}
+    live_report = get_report_writer(state.get("run_id"))
+    # Guards `summaries`, the keys being summarized and the keys already queued.
+    lock = threading.Lock()
+    in_progress = set()
+    queued = set()
+
+    def summarize(website, title, link, content):
+        with lock:
+            if (website, link) in summaries or (website, link) in in_progress:
+                return
+            in_progress.add((website, link))
+        try:
+            summary = {"link": link, "summary": summarizer.summarize(content)}
+        except Exception as e:
+            summary = f"Could not summarize article. Error: {e}"
+        with lock:
+            summaries[(website, link)] = summary
+            in_progress.discard((website, link))
+        if isinstance(summary, str):
+            return
+        if store:
+            store.save_summary(key, website, link, summary)
+        if live_report:
+            live_report[0].add(website, title, summary)
+
+    def consume():
+        while True:
+            item = articles.get()
+            if item is None:
+                return
+            website, title, link, content = item
+            summarize(website, title, link, content)
+            summarizer_progress.write(f"Summarized '{title}'...", kind="article")
+
+    consumers = [
+        threading.Thread(target=run_in_context(consume), daemon=True)
+        for _ in range(summarizer.max_concurrency)
+    ]
+    for consumer in consumers:
+        consumer.start()
+
+    def enqueue(website, title, link, content):
+        with lock:
+            if (website, link) in queued:
+                return
+            queued.add((website, link))
+        if index.add((website, link), link, content) is None:
+            articles.put((website, title, link, content))
+
+    try:
+        scraped_articles, article_stats = scrape_for_run(state, progress, on_article=enqueue)
+    finally:
+        for _ in consumers:
+            articles.put(None)
+
+    progress.write("- Scraping complete, finishing summaries...")
+    for consumer in consumers:
+        consumer.join()
+    scraped_articles, dedup_stats = deduplicate(scraped_articles, index)
+
+    summarized_dict = {}
+    for website, articles_dict in scraped_articles.items():
+        if not articles_dict: continue
+        summarized_dict[website] = {}
+        for title, article_content_dict in articles_dict.items():
+            summarize(website, title, article_content_dict["link"], article_content_dict["content"])
+            summarized_dict[website][title] = summaries[(website, article_content_dict["link"])]
+
+    article_cache_stats = article_stats.as_dict()
+    summary_cache_stats = summarizer.cache_stats.as_dict()
+    progress.write(
+        f"- Summarization complete. Article cache: {article_cache_stats['hits']} hits, {article_cache_stats['misses']} misses. "
+        f"Summary cache: {summary_cache_stats['hits']} hits, {summary_cache_stats['misses']} misses. "
+        f"Duplicates skipped: {dedup_stats['duplicates']}."
+    )
+
+    return {
+        "scraped_articles": scraped_articles,
+        "summarized_articles": summarized_dict,
+        "article_cache_stats": article_cache_stats,
+        "summary_cache_stats": summary_cache_stats,
+        "dedup_stats": dedup_stats
+    }
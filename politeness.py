@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+from urllib.parse import urlparse
+import threading
+import time
+from singletons import process_singleton
+import config
+
+
+class DomainThrottle:
+    """
+    Politeness limits for a single domain.
+
+    At most `max_in_flight` page loads run against the domain at once, and
+    consecutive loads start at least `min_interval` seconds apart.
+    """
+    def __init__(self, max_in_flight, min_interval):
+        self.max_in_flight = max_in_flight
+        self.min_interval = min_interval
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    @contextmanager
+    def slot(self):
+        """Blocks until a request to the domain may start, and holds its slot until the block exits."""
+        with self._slots:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+@process_singleton
+def get_domain_throttle(domain):
+    """Returns the process-wide throttle of `domain`."""
+    max_in_flight, min_interval = config.DOMAIN_POLITENESS.get(
+        domain, (config.DOMAIN_MAX_IN_FLIGHT, config.DOMAIN_MIN_INTERVAL)
+    )
+    return DomainThrottle(max_in_flight, min_interval)
+
+
+def get_throttle(url):
+    """Returns the process-wide throttle for the domain of `url`."""
+    return get_domain_throttle(urlparse(url).netloc.lower())
@@ -0,0 +1,151 @@
+from collections import namedtuple
+from contextlib import contextmanager
+import logging
+import queue
+import threading
+import time
+import uuid
+import config
+
+ProgressEvent = namedtuple("ProgressEvent", ["time", "source", "kind", "message", "data"])
+
+# Event kinds emitted once per article; bursts of them are coalesced on flush.
+COALESCED_KINDS = ("article",)
+
+
+class LogSink:
+    """Progress sink for headless runs: writes every message to a logger."""
+    def __init__(self, logger=None):
+        self.logger = logger or logging.getLogger("research_agent.progress")
+
+    def write(self, message):
+        self.logger.info(message)
+
+
+class ProgressSource:
+    """A writer that tags its events with a source name, e.g. the website being scraped."""
+    def __init__(self, bus, name):
+        self.bus = bus
+        self.name = name
+
+    def write(self, message, kind="info", **data):
+        self.bus.emit(message, source=self.name, kind=kind, **data)
+
+
+class ProgressBus:
+    """
+    Carries the progress events of one run from any thread to its sinks.
+
+    `emit` only puts a structured event on a queue, so scraping and summarization
+    threads never wait for the UI. Once started, a flusher thread delivers the
+    queued events every `interval` seconds; "article" events of the same source
+    that arrive within one interval are coalesced into a single line. Sinks are
+    objects with a `write(message)` method, such as a Job or a LogSink. A bus that
+    was not started delivers every event immediately.
+    """
+    def __init__(self, sinks=(), interval=None):
+        self.sinks = list(sinks)
+        self.interval = config.PROGRESS_FLUSH_INTERVAL if interval is None else interval
+        self._events = queue.SimpleQueue()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def emit(self, message, source=None, kind="info", **data):
+        self._events.put(ProgressEvent(time.time(), source, kind, message, data))
+        if self._thread is None:
+            self.flush()
+
+    def write(self, message, kind="info", **data):
+        self.emit(message, kind=kind, **data)
+
+    def source(self, name):
+        return ProgressSource(self, name)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="progress-flusher", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stops the flusher thread and delivers the remaining events."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        with self._flush_lock:
+            events = []
+            while True:
+                try:
+                    events.append(self._events.get_nowait())
+                except queue.Empty:
+                    break
+            for message in coalesce(events):
+                for sink in self.sinks:
+                    try:
+                        sink.write(message)
+                    except Exception as e:
+                        print(f"Progress sink failed. Error: {e}")
+
+
+def format_event(event):
+    return f"[{event.source}] {event.message}" if event.source else str(event.message)
+
+
+def coalesce(events):
+    """
+    Formats events as messages, replacing each burst of "article" events of one
+    source by its latest message and the number of events it stands for.
+    """
+    messages = []
+    bursts = {}
+    for event in events:
+        if event.kind not in COALESCED_KINDS:
+            messages.append(format_event(event))
+            continue
+        burst = bursts.get((event.source, event.kind))
+        if burst is None:
+            bursts[(event.source, event.kind)] = [len(messages), event, 1]
+            messages.append(None)
+        else:
+            burst[1] = event
+            burst[2] += 1
+    for index, event, events_seen in bursts.values():
+        more = f" (+{events_seen - 1} more)" if events_seen > 1 else ""
+        messages[index] = format_event(event) + more
+    return messages
+
+
+_runs = {}
+_runs_lock = threading.Lock()
+_fallback = ProgressBus([LogSink()])
+
+
+@contextmanager
+def open_run(*sinks, interval=None):
+    """
+    Registers a progress bus for a graph run and yields its run_id, which nodes
+    pass to `get_progress`. Remaining events are flushed when the block exits.
+    """
+    run_id = uuid.uuid4().hex
+    bus = ProgressBus(sinks, interval)
+    with _runs_lock:
+        _runs[run_id] = bus
+    bus.start()
+    try:
+        yield run_id
+    finally:
+        bus.close()
+        with _runs_lock:
+            del _runs[run_id]
+
+
+def get_progress(run_id):
+    """Returns the progress bus of a run, or a bus that logs the events when the run is unknown."""
+    with _runs_lock:
+        return _runs.get(run_id, _fallback)
@@ -0,0 +1,117 @@
+from collections import deque
+import random
+import re
+import threading
+import time
+from singletons import process_singleton
+import config
+
+
+class RateLimiter:
+    """
+    Sliding one-minute window limiting requests and tokens per minute.
+
+    `acquire` blocks until the call fits in both budgets. A limit of 0 disables
+    that budget. A single call larger than the whole token budget is let through
+    once the window is empty, so it can never block forever.
+    """
+    def __init__(self, requests_per_minute, tokens_per_minute, clock=time.monotonic, sleep=time.sleep):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._window = deque()
+        self._tokens = 0
+
+    def acquire(self, tokens=0):
+        while True:
+            with self._lock:
+                now = self._clock()
+                while self._window and now - self._window[0][0] >= 60:
+                    self._tokens -= self._window.popleft()[1]
+
+                requests_ok = not self.requests_per_minute or len(self._window) < self.requests_per_minute
+                tokens_ok = (not self.tokens_per_minute or not self._window
+                             or self._tokens + tokens <= self.tokens_per_minute)
+                if requests_ok and tokens_ok:
+                    self._window.append((now, tokens))
+                    self._tokens += tokens
+                    return
+                delay = self._window[0][0] + 60 - now
+            self._sleep(max(delay, 0.05))
+
+
+@process_singleton
+def get_rate_limiter(model):
+    """Returns the process-wide rate limiter for `model`, shared by every concurrent run."""
+    return RateLimiter(config.LLM_REQUESTS_PER_MINUTE, config.LLM_TOKENS_PER_MINUTE)
+
+
+@process_singleton
+def get_llm_slots():
+    """
+    Returns the process-wide semaphore that caps LLM calls in flight across all
+    runs and models at LLM_MAX_IN_FLIGHT.
+    """
+    return threading.BoundedSemaphore(max(1, config.LLM_MAX_IN_FLIGHT))
+
+
+def estimate_tokens(text):
+    """Rough token count used for rate limiting (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+# Status names of Google API errors and the HTTP codes they stand for.
+STATUS_NAMES = {"RESOURCE_EXHAUSTED": 429, "INTERNAL": 500, "UNAVAILABLE": 503, "DEADLINE_EXCEEDED": 504}
+# An HTTP status line at the start of an error message, e.g. "429 RESOURCE_EXHAUSTED. {...}".
+STATUS_LINE = re.compile(r"^(\d{3}) [A-Za-z]")
+
+
+def status_code(error):
+    """
+    Best-effort HTTP status of an LLM client error, or None when it has none.
+
+    The error, the error it was raised from (LangChain wraps the SDK's error) and
+    their responses are checked for a numeric code, then for a status name. Only
+    then is the text parsed, and only a status line at the start of a message,
+    so numbers elsewhere (e.g. "max 512 tokens") are not taken for a status.
+    """
+    errors = [e for e in (error, error.__cause__) if e is not None]
+    candidates = errors + [getattr(e, "response", None) for e in errors]
+    for candidate in candidates:
+        for attribute in ("status_code", "code"):
+            value = getattr(candidate, attribute, None)
+            if isinstance(value, int):
+                return value
+    for candidate in candidates:
+        status = getattr(candidate, "status", None)
+        if status in STATUS_NAMES:
+            return STATUS_NAMES[status]
+    for e in errors:
+        match = STATUS_LINE.match(str(e))
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def is_retryable(error):
+    code = status_code(error)
+    return code is not None and (code == 429 or 500 <= code < 600)
+
+
+def call_with_retry(fn, max_attempts=None, base_delay=None, sleep=time.sleep):
+    """
+    Calls `fn`, retrying with jittered exponential backoff on 429 and 5xx errors.
+
+    Other errors, and the last retryable one, are raised to the caller.
+    """
+    max_attempts = max_attempts or config.LLM_MAX_ATTEMPTS
+    base_delay = config.LLM_RETRY_BASE_DELAY if base_delay is None else base_delay
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_retryable(e):
+                raise
+            sleep(base_delay * (2 ** attempt) * random.uniform(0.5, 1.5))
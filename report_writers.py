@@ -0,0 +1,245 @@
+from contextlib import contextmanager
+from datetime import datetime
+import html
+import io
+import json
+import os
+import threading
+
+
+class ReportWriter:
+    """
+    Writes a report article by article to a binary stream.
+
+    Articles can be added as soon as they are summarized, in any order. Those of
+    the first publication seen are written at once; the others are held per
+    publication and written by `finish`, so every publication gets one section.
+    Adding an article of a publication twice (same link, or same title when the
+    entry has no link) is a no-op, so a report that was fed incrementally can be
+    completed with `add_all` before `finish`.
+    Subclasses implement `begin`, `start_publication`, `write_article` and `end`,
+    and set the `label` shown in the UI, the file `extension` and the `mime` type.
+    """
+    label = ""
+    extension = ""
+    mime = "application/octet-stream"
+
+    def __init__(self, query, stream):
+        self.query = query
+        self.stream = stream
+        self.generated_at = datetime.now()
+        self._lock = threading.Lock()
+        self._publication = None
+        self._written = set()
+        self._pending = {}
+        self.begin()
+
+    def add(self, publication, title, entry):
+        if isinstance(entry, str):
+            # Articles that failed to summarize hold the error message.
+            entry = {"summary": entry}
+        key = (publication, entry.get("link") or title)
+        with self._lock:
+            if key in self._written:
+                return
+            self._written.add(key)
+            article = (title, entry.get("summary", "Summary not available."), entry.get("link", "Link not available."))
+            if self._publication is None:
+                self._publication = publication
+                self.start_publication(publication)
+            if publication == self._publication:
+                self.write_article(publication, *article)
+            else:
+                self._pending.setdefault(publication, []).append(article)
+
+    def add_all(self, summarized_dict):
+        for publication, summary_dict in summarized_dict.items():
+            for title, entry in (summary_dict or {}).items():
+                self.add(publication, title, entry)
+
+    def finish(self):
+        with self._lock:
+            for publication, articles in self._pending.items():
+                self.start_publication(publication)
+                for article in articles:
+                    self.write_article(publication, *article)
+            self._pending.clear()
+            self.end()
+            self.stream.flush()
+
+    def begin(self):
+        pass
+
+    def start_publication(self, publication):
+        pass
+
+    def write_article(self, publication, title, summary, link):
+        raise NotImplementedError
+
+    def end(self):
+        pass
+
+
+class DocxReportWriter(ReportWriter):
+    """The Word report. python-docx keeps the document in memory until `finish` saves it to the stream."""
+    label = "Word"
+    extension = "docx"
+    mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+    def begin(self):
+        from docx import Document
+
+        self.doc = Document()
+        self.doc.add_heading(f'Research Analysis: {self.query}', 0)
+        self.doc.add_paragraph(f"Generated on: {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        self.doc.add_paragraph("")
+
+    def start_publication(self, publication):
+        self.doc.add_heading(publication, level=1)
+        self.doc.add_paragraph("")
+
+    def write_article(self, publication, title, summary, link):
+        self.doc.add_heading(title, level=2)
+        self.doc.add_paragraph(summary)
+        self.doc.add_paragraph(f"Source: {link}")
+        self.doc.add_paragraph("")
+
+    def end(self):
+        self.doc.save(self.stream)
+
+
+class TextReportWriter(ReportWriter):
+    """Base for text formats, which are written through to the stream as articles arrive."""
+    def __init__(self, query, stream):
+        self.text = io.TextIOWrapper(stream, encoding="utf-8", newline="\n", write_through=True)
+        super().__init__(query, stream)
+
+    def finish(self):
+        super().finish()
+        self.text.detach()
+
+
+class MarkdownReportWriter(TextReportWriter):
+    label = "Markdown"
+    extension = "md"
+    mime = "text/markdown"
+
+    def begin(self):
+        self.text.write(f"# Research Analysis: {self.query}\n\n")
+        self.text.write(f"Generated on: {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+    def start_publication(self, publication):
+        self.text.write(f"## {publication}\n\n")
+
+    def write_article(self, publication, title, summary, link):
+        self.text.write(f"### {title}\n\n{summary}\n\nSource: {link}\n\n")
+
+
+class HtmlReportWriter(TextReportWriter):
+    label = "HTML"
+    extension = "html"
+    mime = "text/html"
+
+    def begin(self):
+        query = html.escape(self.query)
+        self.text.write(
+            f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>Research Analysis: {query}</title></head>\n<body>\n"
+            f"<h1>Research Analysis: {query}</h1>\n"
+            f"<p>Generated on: {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>\n"
+        )
+
+    def start_publication(self, publication):
+        self.text.write(f"<h2>{html.escape(publication)}</h2>\n")
+
+    def write_article(self, publication, title, summary, link):
+        paragraphs = "".join(f"<p>{html.escape(p)}</p>" for p in summary.split("\n\n") if p.strip())
+        source = html.escape(link)
+        if link.startswith(("http://", "https://")):
+            source = f"<a href=\"{source}\">{source}</a>"
+        self.text.write(f"<h3>{html.escape(title)}</h3>\n{paragraphs}\n<p>Source: {source}</p>\n")
+
+    def end(self):
+        self.text.write("</body>\n</html>\n")
+
+
+class JsonlReportWriter(TextReportWriter):
+    """One JSON object per line: a header with the query, then one line per article."""
+    label = "JSON Lines"
+    extension = "jsonl"
+    mime = "application/jsonl"
+
+    def begin(self):
+        self._line({"query": self.query, "generated_at": self.generated_at.isoformat(timespec="seconds")})
+
+    def write_article(self, publication, title, summary, link):
+        self._line({"publication": publication, "title": title, "summary": summary, "link": link})
+
+    def _line(self, record):
+        self.text.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+REPORT_WRITERS = {
+    "docx": DocxReportWriter,
+    "markdown": MarkdownReportWriter,
+    "html": HtmlReportWriter,
+    "jsonl": JsonlReportWriter
+}
+
+
+# UTF-8 bytes of the query kept in report file names, which most filesystems cap at 255 bytes.
+MAX_QUERY_IN_FILE_NAME = 100
+
+
+def report_file_name(query, report_format="docx", generated_at=None, suffix=""):
+    safe_query = "".join(c for c in query if c.isalnum() or c in (' ', '_'))
+    safe_query = safe_query.encode("utf-8")[:MAX_QUERY_IN_FILE_NAME].decode("utf-8", "ignore").rstrip()
+    safe_query = safe_query.replace(' ', '_')
+    generated_at = generated_at or datetime.now()
+    suffix = f"_{suffix}" if suffix else ""
+    return f"research_analysis_{safe_query}_{generated_at.strftime('%Y%m%d_%H%M%S')}{suffix}.{REPORT_WRITERS[report_format].extension}"
+
+
+def write_report(query, summarized_dict, stream, report_format="docx"):
+    """Writes a complete report of `summarized_dict` to a binary stream."""
+    writer = REPORT_WRITERS[report_format](query, stream)
+    writer.add_all(summarized_dict)
+    writer.finish()
+    return writer
+
+
+_live_reports = {}
+_live_reports_lock = threading.Lock()
+
+
+@contextmanager
+def open_report_file(run_id, query, directory, report_format="docx"):
+    """
+    Opens the report file of a graph run and registers its writer under `run_id`,
+    so that nodes can add summaries as they arrive (see `get_report_writer`).
+    Yields the path of the file, whose name ends with the start of `run_id` so
+    that runs of the same query in the same second get their own files. The
+    file is removed when the run fails, so no incomplete report is left behind.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, report_file_name(query, report_format, suffix=run_id[:8]))
+    stream = open(path, "xb")
+    try:
+        writer = REPORT_WRITERS[report_format](query, stream)
+        with _live_reports_lock:
+            _live_reports[run_id] = (writer, path)
+        try:
+            yield path
+        finally:
+            with _live_reports_lock:
+                del _live_reports[run_id]
+    except BaseException:
+        stream.close()
+        os.remove(path)
+        raise
+    stream.close()
+
+
+def get_report_writer(run_id):
+    """Returns the (writer, path) of a run that writes its report to a file, or None."""
+    with _live_reports_lock:
+        return _live_reports.get(run_id)
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from singletons import process_singleton
+import config
+
+
+def run_key(params):
+    """Identifies a run by everything that determines its output."""
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class RunStore:
+    """
+    Persists the progress of graph runs so that a failed run can be resumed.
+
+    A website is stored with its articles once it was scraped without errors, and
+    every summary as soon as it is produced. A rerun with the same parameters
+    skips the stored websites and the articles that were already summarized.
+    Websites that failed or were interrupted are scraped again; their article
+    pages then mostly come from the article cache.
+    """
+    def __init__(self, path, ttl):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_key TEXT PRIMARY KEY, params TEXT NOT NULL, status TEXT NOT NULL, "
+            "created REAL NOT NULL, updated REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS site_results ("
+            "run_key TEXT NOT NULL, website TEXT NOT NULL, articles BLOB NOT NULL, "
+            "PRIMARY KEY (run_key, website));"
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "run_key TEXT NOT NULL, website TEXT NOT NULL, link TEXT NOT NULL, entry TEXT NOT NULL, "
+            "PRIMARY KEY (run_key, website, link));"
+        )
+        self._conn.commit()
+
+    def _execute(self, sql, args=()):
+        with self._lock:
+            self._conn.execute(sql, args)
+            self._conn.commit()
+
+    def start_run(self, key, params, resume=True):
+        """
+        Registers a run.
+
+        Returns:
+            str | None: The status of the earlier attempt whose progress will be
+            reused ("running" if it was interrupted, "finished" if it completed),
+            or None when the run starts from scratch.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT created, status FROM runs WHERE run_key = ?", (key,)).fetchone()
+            fresh = row is None or not resume or (self.ttl and now - row[0] > self.ttl)
+            if fresh:
+                for table in ("site_results", "summaries"):
+                    self._conn.execute(f"DELETE FROM {table} WHERE run_key = ?", (key,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO runs (run_key, params, status, created, updated) VALUES (?, ?, ?, ?, ?)",
+                    (key, json.dumps(params, sort_keys=True), "running", now, now)
+                )
+            else:
+                self._conn.execute("UPDATE runs SET status = ?, updated = ? WHERE run_key = ?", ("running", now, key))
+            self._conn.commit()
+        return None if fresh else row[1]
+
+    def finish_run(self, key):
+        self._execute("UPDATE runs SET status = ?, updated = ? WHERE run_key = ?", ("finished", time.time(), key))
+
+    def complete_site(self, key, website, articles):
+        """Stores a website that was scraped without errors; `articles` is its final title -> article dict."""
+        self._execute(
+            "INSERT OR REPLACE INTO site_results (run_key, website, articles) VALUES (?, ?, ?)",
+            (key, website, zlib.compress(json.dumps(articles).encode("utf-8")))
+        )
+
+    def completed_sites(self, key):
+        """Returns the scraped articles of every website that finished in an earlier attempt."""
+        with self._lock:
+            rows = self._conn.execute("SELECT website, articles FROM site_results WHERE run_key = ?", (key,)).fetchall()
+        return {website: json.loads(zlib.decompress(articles).decode("utf-8")) for website, articles in rows}
+
+    def save_summary(self, key, website, link, entry):
+        self._execute(
+            "INSERT OR REPLACE INTO summaries (run_key, website, link, entry) VALUES (?, ?, ?, ?)",
+            (key, website, link, json.dumps(entry))
+        )
+
+    def summaries(self, key):
+        """Returns the stored summary entries of a run, keyed by (website, link)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT website, link, entry FROM summaries WHERE run_key = ?", (key,)).fetchall()
+        return {(website, link): json.loads(entry) for website, link, entry in rows}
+
+
+@process_singleton
+def get_run_store():
+    """Returns the process-wide run store."""
+    return RunStore(os.path.join(config.CACHE_DIR, "runs.sqlite3"), ttl=config.RUN_STORE_TTL)
@@ -1,270 +1,468 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from collections import Counter
+from functools import partial
 import time
 from overall_state import OverallState
-
-def scraping_router(state: OverallState) -> dict:
-    websites = state.get("websites_to_search", [])
-    query = state.get("messages", [])[-1].content
-    pages_to_search = state.get("pages_to_search", 1)
-    page_depth  = state.get("page_depth", 10)
-    ui_container = state.get("ui_container")
-
-    ieee_scraped_articles = {}
-    springer_scraped_articles = {}
-    mdpi_scraped_artciles = {}
-
-    for website in websites:
-        if website == "IEEE":
-            ui_container.write("- Scraping IEEE articles...")
-            ieee_scraped_articles = scrape_ieee(query, pages_to_search, page_depth, ui_container)
-        elif website == "Springer":
-            ui_container.write("- Scraping Springer articles...")
-            springer_scraped_articles = scrape_springer(query, pages_to_search, page_depth, ui_container)
-        elif website == "MDPI":
-            ui_container.write("- Scraping MDPI articles...")
-            mdpi_scraped_artciles = scrape_mdpi(query, pages_to_search, page_depth, ui_container)
-
-    scraped_articles = {
-        "IEEE": ieee_scraped_articles,
-        "Springer": springer_scraped_articles,
-        "MDPI": mdpi_scraped_artciles
+from driver_pool import get_driver_pool
+from politeness import get_throttle
+from http_fetch import download, parse_article
+from cache import CacheStats, get_article_cache, normalize_url
+from instrumentation import count, run_in_context, span
+from run_store import get_run_store
+from progress import get_progress
+from local_index import search_local
+from sites import LOCAL_SOURCE, SITES, search_url
+from waits import get_wait_policy, site_for_url, wait_for
+from summarization import LIMITS
+import config
+
+# Collects the paragraphs of an article container in a single WebDriver call,
+# stopping once max_chars characters have been gathered.
+READ_ARTICLE_SCRIPT = """
+const [container, selector, maxChars] = arguments;
+const parts = [];
+let size = 0;
+for (const paragraph of container.querySelectorAll(selector)) {
+    const text = paragraph.innerText.trim();
+    if (!text) continue;
+    if (maxChars !== null && size + text.length >= maxChars) {
+        parts.push(text.slice(0, Math.max(0, maxChars - size)));
+        break;
     }
+    parts.push(text);
+    size += text.length + 2;
+}
+return [document.title, parts.join("\\n\\n")];
+"""
 
-    return {
-        "scraped_articles": scraped_articles
-    }
+
+def read_article(driver, container, paragraph_selector, max_chars=None):
+    """
+    Returns the page title and the text of the paragraphs in `container`.
+
+    The text is read in the page by one script call instead of one WebDriver
+    round trip per paragraph, and only the first `max_chars` characters are
+    transferred.
+    """
+    title, doc_text = driver.execute_script(READ_ARTICLE_SCRIPT, container, paragraph_selector, max_chars)
+    return title, doc_text
+
+
+# Sources that are not websites, with the same signature as scrape_search_site minus the site.
+SOURCES = {
+    LOCAL_SOURCE: search_local
+}
 
 
+def get_scraper(website):
+    """Returns the scrape function of a source name, or None when the name is unknown."""
+    if website in SITES:
+        return partial(scrape_search_site, SITES[website])
+    return SOURCES.get(website)
 
-def scrape_ieee(query, pages_to_search, page_depth, ui_container):
+
+def scrape_site(website, *args):
+    """
+    Runs the scraper of one source. Returns its articles and a Counter of the
+    result pages and articles that failed ("page_errors", "article_errors"),
+    which are also added to the run's counters under the website name.
+    """
+    errors = Counter()
+    try:
+        with span(website, "site"):
+            articles = get_scraper(website)(*args, errors=errors)
+    except Exception:
+        count(f"{website}.errors")
+        raise
+    count(f"{website}.articles", len(articles))
+    for kind, amount in errors.items():
+        count(f"{website}.{kind}", amount)
+    return articles, errors
+
+
+def site_stats(trace):
+    """
+    Summarizes the sources of a run from its trace (see Tracer.to_dict).
+
+    Returns:
+        list: One row per source with its scraping time, search result pages,
+        articles, failed pages and articles, and articles per second.
+    """
+    counters = trace["counters"]
+    rows = []
+    for site_span in trace["spans"]:
+        if site_span["category"] != "site":
+            continue
+        website = site_span["name"]
+        articles = counters.get(f"{website}.articles", 0)
+        rows.append({
+            "site": website,
+            "duration_s": round(site_span["duration"], 2),
+            "pages": counters.get(f"{website}.pages", 0),
+            "articles": articles,
+            "page_errors": counters.get(f"{website}.page_errors", 0),
+            "article_errors": counters.get(f"{website}.article_errors", 0),
+            "errors": counters.get(f"{website}.errors", 0),
+            "articles_per_s": round(articles / site_span["duration"], 2) if site_span["duration"] else 0.0
+        })
+    return rows
+
+
+def scrape_sites(websites, query, pages_to_search, page_depth, progress,
+                 max_workers=None, article_workers=None, on_article=None, on_site_done=None, max_chars=None):
     """
-    Scrapes IEEE Xplore for articles based on a query.
+    Scrapes the selected websites concurrently.
 
     Args:
-        query (str): The search query.
-        pages_to_search (int): The number of pages to scrape.
+        websites (list): Names of the sources to scrape (see sites.source_names).
+        progress (ProgressBus): Receives progress events; each site thread writes
+            through its own source, tagged with the website name.
+        on_article (callable, optional): Called from the scraping threads as
+            `on_article(website, title, link, content)` as soon as an article is extracted.
+        on_site_done (callable, optional): Called from the calling thread as
+            `on_site_done(website, articles)` when a website finishes without any
+            failed result page or article, i.e. when its articles are complete.
+        max_chars (int, optional): Characters of article text extracted at most, e.g.
+            the limit of the summarization depth; None extracts the whole text.
 
     Returns:
-        dict: A dictionary of scraped articles with their links and content.
+        tuple: The scraped articles per selected website and the article cache statistics.
+    """
+    max_workers = max_workers or config.MAX_CONCURRENT_SITES
+    article_workers = article_workers or config.ARTICLE_WORKERS
+    cache_stats = CacheStats()
+
+    selected = [website for website in websites if get_scraper(website)]
+    scraped_articles = {website: {} for website in selected}
+    if not selected:
+        return scraped_articles, cache_stats
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(selected)))) as executor:
+        futures = {}
+        for website in selected:
+            progress.write(f"- Scraping {website} articles...")
+            site_on_article = partial(on_article, website) if on_article else None
+            future = executor.submit(run_in_context(scrape_site), website, query, pages_to_search, page_depth,
+                                     progress.source(website), article_workers, cache_stats, site_on_article, max_chars)
+            futures[future] = website
+
+        for future in as_completed(futures):
+            website = futures[future]
+            try:
+                scraped_articles[website], errors = future.result()
+                if errors:
+                    progress.write(
+                        f"- {errors['page_errors']} result pages and {errors['article_errors']} articles of {website} "
+                        f"failed; they will be scraped again if the run is resumed."
+                    )
+                elif on_site_done:
+                    on_site_done(website, scraped_articles[website])
+            except Exception as e:
+                print(f"Scraping {website} failed. Error: {e}")
+                progress.write(f"- Scraping for {website} failed: {e}")
+
+    return scraped_articles, cache_stats
+
+
+def scrape_for_run(state, progress, on_article=None):
     """
-    options = webdriver.ChromeOptions()
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    
-    driver = webdriver.Chrome(options=options)
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    wait = WebDriverWait(driver, 20)
-
-    ieee_scraped_articles = {}
-    query_encoded = query.replace(" ", "%20")
+    Scrapes the websites of a graph run, resuming from the run store when the
+    state carries a run_key.
 
-    for page_no in range(1, pages_to_search + 1):
-        try:
-            url = f"https://ieeexplore.ieee.org/search/searchresult.jsp?queryText={query_encoded}&highlight=true&returnFacets=ALL&returnType=SEARCH&matchPubs=true&openAccess=true&pageNumber={page_no}"
-            driver.get(url)
+    Websites that finished in an earlier attempt of the same run are taken from
+    the store (and still reported to `on_article`); websites that finish without
+    errors are saved as they complete. Arguments and return value are as for
+    scrape_sites.
+    """
+    websites = state.get("websites_to_search", [])
+    key = state.get("run_key")
+    store = get_run_store() if key else None
+    completed = store.completed_sites(key) if store else {}
+    completed = {website: articles for website, articles in completed.items() if website in websites}
+    if completed:
+        progress.write(f"- Resuming: reusing articles of {', '.join(completed)} from the previous attempt...")
+        if on_article:
+            for website, articles in completed.items():
+                for title, article in articles.items():
+                    on_article(website, title, article["link"], article["content"])
+
+    scraped_articles, cache_stats = scrape_sites(
+        [website for website in websites if website not in completed],
+        state.get("messages", [])[-1].content,
+        state.get("pages_to_search", 1),
+        state.get("page_depth", 10),
+        progress,
+        max_workers=state.get("max_concurrent_sites"),
+        article_workers=state.get("article_workers"),
+        on_article=on_article,
+        on_site_done=partial(store.complete_site, key) if store else None,
+        max_chars=LIMITS.get(state.get("summarization_depth", "Moderate"))
+    )
+    scraped_articles.update(completed)
+    return scraped_articles, cache_stats
 
-            elements = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "h3 a.fw-bold")))
-            
-            links = [elem.get_attribute('href') for elem in elements if elem.get_attribute('href')]
 
-            count = 0
+def scraping_router(state: OverallState) -> dict:
+    progress = get_progress(state.get("run_id"))
+    scraped_articles, cache_stats = scrape_for_run(state, progress)
 
-            for link in links:
-                if count == page_depth:
-                    break
-                try:
-                    driver.get(link)
-                    
-                    article = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "ArticlePage")))
-                    paras = article.find_elements(By.TAG_NAME, "p")
-
-                    new_title = driver.title
-                    ui_container.write(f"Scraping {new_title}...")
-
-                    doc_text = ""
-                    for p in paras:
-                        doc_text = doc_text + " " + p.text 
-                    
-                    if doc_text:
-                        ieee_scraped_articles[new_title] = {
-                            "link": link,
-                            "content": doc_text
-                        }
-
-                    count += 1
+    article_cache_stats = cache_stats.as_dict()
+    progress.write(
+        f"- Article cache: {article_cache_stats['hits']} hits, {article_cache_stats['misses']} misses."
+    )
 
-                except Exception as e:
-                    print(f"Could not process link: {link}. Error: {e}")
-                    continue
-        except Exception as e:
-            print(f"Failed to scrape page {page_no}. Error: {e}")
-            continue
+    return {
+        "scraped_articles": scraped_articles,
+        "article_cache_stats": article_cache_stats
+    }
 
-    driver.quit()
-    ui_container.write("- Scraping for IEEE complete...")
-    return ieee_scraped_articles
 
 
+def static_article_spec(site):
+    """Returns the static extraction spec of `site`, or None if it is read in the browser only."""
+    if site.paragraph_xpath is None or config.SITE_FETCH_MODES.get(site.name, config.FETCH_MODE) == "selenium":
+        return None
+    return site.article_class, site.paragraph_xpath
+
+
+def load_page(driver, url):
+    """
+    Navigates `driver` to `url` within the politeness limits of the url's domain.
+    The page load timeout adapts to the site's recent load times.
+    """
+    policy = get_wait_policy(site_for_url(url), "page_load")
+    with get_throttle(url).slot(), span(url, "page_load"):
+        driver.set_page_load_timeout(policy.timeout())
+        start = time.monotonic()
+        try:
+            driver.get(url)
+        except TimeoutException:
+            policy.record_timeout()
+            count("wait_timeouts")
+            raise
+        policy.record(time.monotonic() - start)
 
 
-def scrape_springer(query, pages_to_search, page_depth, ui_container):
+def collect_links(url, results_locator, link_selector):
     """
-    Scrapes Springer Link for articles based on a query.
+    Opens a search results page and returns the article links on it.
 
     Args:
-        query (str): The search query.
-        pages_to_search (int): The number of pages to scrape.
+        url (str): The search results page.
+        results_locator (tuple): Locator of the element that signals the results have rendered.
+        link_selector (str): CSS selector of the article links.
 
     Returns:
-        dict: A dictionary of scraped articles with their links and content.
+        list: The article links in page order.
     """
-    options = webdriver.ChromeOptions()
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    
-    driver = webdriver.Chrome(options=options)
-    
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-    wait = WebDriverWait(driver, 20)
-    springer_scraped_articles = {}
-    query_encoded = query.replace(" ", "+")
+    with get_driver_pool().driver() as driver:
+        load_page(driver, url)
+        wait_for(driver, site_for_url(url), "results", results_locator)
+        elements = driver.find_elements(By.CSS_SELECTOR, link_selector)
+        return [elem.get_attribute('href') for elem in elements if elem.get_attribute('href')]
 
-    for page_no in range(1, pages_to_search + 1):
-        try:
-            url = f"https://link.springer.com/search?query={query_encoded}&openAccess=true&sortBy=relevance&page={page_no}"
-            print(f"Scraping page {page_no}: {url}")
-            driver.get(url)
-            
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'li[data-test="search-result-item"]')))
-            elements = driver.find_elements(By.CSS_SELECTOR, 'h3[data-test="title"] a')
-            
-            links = [elem.get_attribute('href') for elem in elements if elem.get_attribute('href')]
 
-            count = 0
+def fetch_static_article(link, static, max_chars=None):
+    """
+    Fetches an article over plain HTTP, without a browser.
 
-            for link in links:
-                if count == page_depth:
-                    break
-                try:
-                    driver.get(link)
-                    
-                    article = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "main-content")))
-                    paras = article.find_elements(By.TAG_NAME, "p")
-                    
-                    new_title = driver.title
-                    ui_container.write(f"Scraping {new_title}...")
-
-                    doc_text = " ".join([p.text for p in paras])
-                    
-                    if doc_text:
-                        springer_scraped_articles[new_title] = {
-                            "link": link,
-                            "content": doc_text
-                        }
-                    
-                    count += 1
+    Returns:
+        tuple | None: The title and text, or None when the static page lacks the
+        article container or cannot be downloaded.
+    """
+    container_class, paragraph_xpath = static
+    try:
+        with get_throttle(link).slot(), span(link, "http_fetch") as attrs:
+            html = download(link)
+            attrs["bytes"] = len(html)
+        count("bytes_downloaded", len(html))
+        with span(link, "extract"):
+            return parse_article(html, container_class, paragraph_xpath, max_chars)
+    except Exception as e:
+        print(f"Static fetch failed for {link}, falling back to the browser. Error: {e}")
+        return None
+
+
+def load_article(link, extract, progress, static=None, max_chars=None):
+    if static:
+        article = fetch_static_article(link, static, max_chars)
+        if article:
+            progress.write(f"Scraping {article[0]}...", kind="article")
+            return article
+
+    with get_driver_pool().driver() as driver:
+        load_page(driver, link)
+        with span(link, "extract"):
+            return extract(driver, progress, max_chars)
+
+
+def fetch_article(link, extract, progress, static=None, cache_stats=None, max_chars=None):
+    """
+    Returns the title and at most `max_chars` characters of the text of an
+    article, from the article cache when possible.
+
+    On a cache hit the page is not loaded at all; freshly scraped articles with
+    text are stored in the cache under their normalized URL. A cached text that
+    was cut at a smaller limit than `max_chars` counts as a miss.
+    """
+    with span(link, "article"):
+        cache = get_article_cache()
+        key = normalize_url(link)
+        cached = cache.get(key)
+        if cached is not None and cached.get("max_chars") is not None:
+            if max_chars is None or cached["max_chars"] < max_chars:
+                cached = None
+        if cache_stats is not None:
+            cache_stats.record(cached is not None)
+        if cached is not None:
+            progress.write(f"Loaded {cached['title']} from cache...", kind="article")
+            return cached["title"], cached["content"][:max_chars]
+
+        title, doc_text = load_article(link, extract, progress, static, max_chars)
+        count("chars_extracted", len(doc_text))
+        if doc_text:
+            truncated = max_chars is not None and len(doc_text) >= max_chars
+            cache.set(key, {"title": title, "content": doc_text, "max_chars": max_chars if truncated else None})
+        return title, doc_text
+
+
+def add_article(articles, title, link, content):
+    """
+    Adds an article to `articles` under its title and returns the key used.
+
+    Distinct papers can share a page title (e.g. a generic journal title), so a
+    title that is already taken by another link gets a numbered key instead of
+    overwriting it. An article whose link is already present is kept once.
+    """
+    key = title or link
+    number = 2
+    while key in articles:
+        if articles[key]["link"] == link:
+            return key
+        key = f"{title} ({number})"
+        number += 1
+    articles[key] = {"link": link, "content": content}
+    return key
+
+
+def fetch_articles(links, page_depth, extract, article_workers, progress, static=None, cache_stats=None, on_article=None,
+                   articles=None, max_chars=None, errors=None):
+    """
+    Scrapes up to `page_depth` articles from `links` on parallel worker drivers.
+
+    As with visiting the links one by one, a link that fails to load is replaced
+    by the next unvisited one until `page_depth` articles have been processed.
+
+    Args:
+        links (list): Article links from one search results page.
+        page_depth (int): The number of articles to scrape.
+        extract (callable): Takes a driver on the article page, the progress writer and
+            `max_chars`, returns the article title and text.
+        article_workers (int): The number of article pages loaded at the same time.
+        static (tuple, optional): Article container class and paragraph XPath used to
+            read the page over plain HTTP first. The browser is only used when the
+            static HTML lacks the container.
+        cache_stats (CacheStats, optional): Receives the article cache hits and misses.
+        on_article (callable, optional): Called as `on_article(title, link, content)`
+            as soon as each article is extracted.
+        articles (dict, optional): Articles scraped so far, e.g. from earlier result
+            pages; the new ones are added to it with `add_article`.
+        max_chars (int, optional): Characters of text extracted per article at most.
+        errors (Counter, optional): Counts the links that failed under "article_errors".
 
+    Returns:
+        dict: Scraped articles keyed by title, in link order.
+    """
+    links = iter(enumerate(links))
+    results = {}
+    processed = 0
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, article_workers)) as executor:
+        def submit_next():
+            while len(pending) < article_workers and processed + len(pending) < page_depth:
+                index, link = next(links, (None, None))
+                if link is None:
+                    return
+                future = executor.submit(run_in_context(fetch_article), link, extract, progress, static, cache_stats, max_chars)
+                pending[future] = (index, link)
+
+        submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, link = pending.pop(future)
+                try:
+                    title, doc_text = future.result()
                 except Exception as e:
                     print(f"Could not process link: {link}. Error: {e}")
+                    if errors is not None:
+                        errors["article_errors"] += 1
                     continue
-        except Exception as e:
-            print(f"Failed to scrape page {page_no}. Error: {e}")
-            continue
+                processed += 1
+                if doc_text:
+                    results[index] = (title, link, doc_text)
+                    if on_article:
+                        on_article(title, link, doc_text)
+            submit_next()
+
+    articles = {} if articles is None else articles
+    for _, (title, link, doc_text) in sorted(results.items()):
+        add_article(articles, title, link, doc_text)
+    return articles
 
-    driver.quit()
-    ui_container.write("- Scraping for Springer complete...")
-    return springer_scraped_articles
 
 
+def extract_article(site, driver, progress, max_chars=None):
+    """Reads the article on the page `driver` is at, once its body has rendered."""
+    article = wait_for(driver, site.name, "article", (By.CLASS_NAME, site.article_class))
+    new_title, doc_text = read_article(driver, article, site.paragraph_selector, max_chars)
+    progress.write(f"Scraping {new_title}...", kind="article")
+    return new_title, doc_text
 
-def scrape_mdpi(query, pages_to_search, page_depth, ui_container):
+
+def scrape_search_site(site, query, pages_to_search, page_depth, progress, article_workers=config.ARTICLE_WORKERS, cache_stats=None,
+                       on_article=None, max_chars=None, errors=None):
     """
-    Scrapes MDPI for articles based on a query using regular Selenium.
+    Scrapes a website described by a site definition for articles based on a query.
+
+    Each search results page is opened in the browser, and up to `page_depth` of
+    its article links are fetched in parallel, over plain HTTP when the site allows
+    it. Result pages are counted under the site name.
 
     Args:
+        site (SiteDefinition): The website to search.
         query (str): The search query.
         pages_to_search (int): The number of pages to scrape.
+        page_depth (int): The number of articles to scrape per page.
+        article_workers (int): The number of article pages loaded in parallel.
+        cache_stats (CacheStats, optional): Receives the article cache hits and misses.
+        on_article (callable, optional): Called as `on_article(title, link, content)`
+            as soon as each article is extracted.
+        max_chars (int, optional): Characters of text extracted per article at most.
+        errors (Counter, optional): Counts the result pages ("page_errors") and
+            articles ("article_errors") that failed.
 
     Returns:
         dict: A dictionary of scraped articles with their links and content.
     """
-    options = webdriver.ChromeOptions()
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    
-    options.add_argument("--headless") 
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
-    
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-
-    driver = webdriver.Chrome(options=options)
-
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-    wait = WebDriverWait(driver, 20)
-    mdpi_scraped_articles = {}
-    query_encoded = query.replace(" ", "+")
-
-    for page_no in range(pages_to_search):
-        try:
-            url = f"https://www.mdpi.com/search?q={query_encoded}&page_no={page_no + 1}"
-            driver.get(url)
-            time.sleep(3)
-            
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, 'article-listing')))
-            elements = driver.find_elements(By.CLASS_NAME, 'title-link')
-            
-            links = [elem.get_attribute('href') for elem in elements if elem.get_attribute('href')]
-
-            count = 0
-
-            for link in links:
-                if count == page_depth:
-                    break
-                try:
-                    driver.get(link)
-                    time.sleep(2)
-                    new_title = driver.title
-                    ui_container.write(f"Scraping {new_title}...")
-                    doc_text = ""
+    scraped_articles = {}
 
-                    article = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "html-article-content")))
-                    paras = article.find_elements(By.CLASS_NAME, "html-p")
-                    doc_text = " ".join([p.text for p in paras])
-
-
-                    if doc_text:
-                        mdpi_scraped_articles[new_title] = {
-                            "link": link,
-                            "content": doc_text
-                        }
-
-                    count += 1
-
-                except Exception as e:
-                    print(f"Could not process link: {link}. Error: {e}")
-                    continue
+    for page_no in range(1, pages_to_search + 1):
+        url = search_url(site, query, page_no)
+        try:
+            links = collect_links(url, (By.CSS_SELECTOR, site.results_selector), site.link_selector)
         except Exception as e:
-            print(f"Failed to scrape page {page_no}. Error: {e}")
+            print(f"Failed to scrape {site.name} page {page_no}: {url}. Error: {e}")
+            if errors is not None:
+                errors["page_errors"] += 1
             continue
+        count(f"{site.name}.pages")
+
+        fetch_articles(links, page_depth, partial(extract_article, site), article_workers, progress, static_article_spec(site),
+                       cache_stats, on_article, articles=scraped_articles, max_chars=max_chars, errors=errors)
 
-    driver.quit()
-    ui_container.write("- Scraping for MDPI complete...")
-    return mdpi_scraped_articles
\ No newline at end of file
+    progress.write(f"- Scraping for {site.name} complete...")
+    return scraped_articles
@@ -0,0 +1,24 @@
+from functools import lru_cache, wraps
+import threading
+
+
+def process_singleton(factory):
+    """
+    Turns `factory` into a getter of process-wide instances, one per distinct
+    argument tuple (e.g. one driver pool, one rate limiter per model).
+
+    Works like `functools.lru_cache(maxsize=None)`, except that concurrent first
+    calls are serialized, so the factory runs exactly once per key even when
+    several threads ask for the instance at the same time. `cache_clear()` drops
+    the instances, e.g. after changing config in tests or benchmarks.
+    """
+    cached = lru_cache(maxsize=None)(factory)
+    lock = threading.RLock()
+
+    @wraps(factory)
+    def get(*args):
+        with lock:
+            return cached(*args)
+
+    get.cache_clear = cached.cache_clear
+    return get
@@ -0,0 +1,92 @@
+from collections import namedtuple
+from urllib.parse import quote, quote_plus
+import os
+import config
+
+
+class SiteDefinition(namedtuple("SiteDefinition", [
+    "name", "base_url", "search_path", "results_selector", "link_selector",
+    "article_class", "paragraph_selector", "paragraph_xpath", "quote_query", "results_per_page"
+], defaults=[quote_plus, 0])):
+    """
+    Declarative description of a searchable website, scraped by scraper.scrape_search_site.
+
+    Fields:
+        name (str): The source name shown in the UI and used as the result key.
+        base_url (str): Where the site is scraped from; see `site_base_url` for overrides.
+        search_path (str): Search results URL relative to the base URL. "{query}" is
+            replaced by the encoded query, "{page}" by the page number starting at 1
+            and "{offset}" by the index of the page's first result.
+        results_selector (str): CSS selector of the element that appears once the
+            search results have rendered.
+        link_selector (str): CSS selector of the article links on a results page.
+        article_class (str): CSS class of the element holding the article body.
+        paragraph_selector (str): CSS selector of the paragraphs inside the article body.
+        paragraph_xpath (str | None): The same paragraphs as an XPath relative to the
+            body, used to read the article over plain HTTP. None always uses the browser.
+        quote_query (callable): Encodes the query for the URL (quote_plus or quote).
+        results_per_page (int): Results per page, needed by "{offset}" paging.
+    """
+    __slots__ = ()
+
+
+# Every website that can be searched. Adding a source is a matter of adding its entry here.
+SITES = {site.name: site for site in [
+    SiteDefinition(
+        name="IEEE",
+        base_url="https://ieeexplore.ieee.org",
+        search_path="/search/searchresult.jsp?queryText={query}&highlight=true&returnFacets=ALL&returnType=SEARCH"
+                    "&matchPubs=true&openAccess=true&pageNumber={page}",
+        results_selector="h3 a.fw-bold",
+        link_selector="h3 a.fw-bold",
+        article_class="ArticlePage",
+        paragraph_selector="p",
+        paragraph_xpath=".//p",
+        quote_query=quote
+    ),
+    SiteDefinition(
+        name="Springer",
+        base_url="https://link.springer.com",
+        search_path="/search?query={query}&openAccess=true&sortBy=relevance&page={page}",
+        results_selector='li[data-test="search-result-item"]',
+        link_selector='h3[data-test="title"] a',
+        article_class="main-content",
+        paragraph_selector="p",
+        paragraph_xpath=".//p"
+    ),
+    SiteDefinition(
+        name="MDPI",
+        base_url="https://www.mdpi.com",
+        search_path="/search?q={query}&page_no={page}",
+        results_selector=".article-listing",
+        link_selector=".title-link",
+        article_class="html-article-content",
+        paragraph_selector=".html-p",
+        paragraph_xpath=".//*[contains(concat(' ', normalize-space(@class), ' '), ' html-p ')]"
+    )
+]}
+
+# Sources that are not websites; scraper.SOURCES maps them to their search function.
+LOCAL_SOURCE = "Local"
+
+
+def source_names():
+    """Returns the names of every source that can be selected: the websites, then the local index."""
+    return list(SITES) + [LOCAL_SOURCE]
+
+
+def site_base_url(site):
+    """
+    Returns the base URL of a site: SITE_BASE_URLS in config, then the
+    <NAME>_BASE_URL environment variable (e.g. IEEE_BASE_URL), then the definition.
+    """
+    return config.SITE_BASE_URLS.get(site.name) or os.getenv(f"{site.name.upper()}_BASE_URL") or site.base_url
+
+
+def search_url(site, query, page_no):
+    """Returns the URL of results page `page_no` (starting at 1) of `site` for `query`."""
+    return site_base_url(site) + site.search_path.format(
+        query=site.quote_query(query),
+        page=page_no,
+        offset=(page_no - 1) * site.results_per_page
+    )
@@ -1,7 +1,16 @@
 from overall_state import OverallState
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.runnables import RunnableLambda
+from cache import CacheStats, get_summary_cache, summary_cache_key
+from rate_limiter import call_with_retry, estimate_tokens, get_llm_slots, get_rate_limiter
+from chunking import count_tokens, split_into_chunks
+from instrumentation import count, span
+from run_store import get_run_store
+from progress import get_progress
+from report_writers import get_report_writer
+from singletons import process_singleton
 import os
 import json
+import config
 
 output_schema = {
      "type": "object",
@@ -14,46 +23,193 @@ output_schema = {
      "required": ["summary"]
 }
 
-def summarize_articles_node(state: OverallState) -> dict:
-    """Node for summarizing the content of scraped articles using an LLM."""
-    ui_container = state.get("ui_container")
-    ui_container.write("Starting summarization process...")
+PROMPT_TEMPLATE = "Summarize the following research article in 2-3 paragraphs, focusing on key findings and methodology.\n\n{content}"
 
-    api_key = os.getenv("GEMINI_API_KEY")
+CHUNK_PROMPT_TEMPLATE = "Summarize the following excerpt of a research article in one paragraph, keeping its key findings, methods and numbers.\n\n{content}"
+
+REDUCE_PROMPT_TEMPLATE = "The following are summaries of consecutive parts of one research article. Combine them into a single summary of the article in 2-3 paragraphs, focusing on key findings and methodology.\n\n{content}"
+
+LIMITS = {
+    "Low": 10000,
+    "Moderate": 15000,
+    "High": 25000,
+    "Max": None
+}
+
+class Summarizer:
+    """
+    Summarizes article content with one model for one run.
+
+    Summaries are looked up in the summary cache first; otherwise the LLM is
+    called under the model's rate limits and retried with backoff on 429 and
+    5xx errors. In chunked mode, content longer than `chunk_tokens` is split on
+    paragraph boundaries, the chunks are summarized in parallel and the partial
+    summaries are reduced into the final one. Chunk summaries are cached on
+    their own, so an article that only partly changed reuses the rest.
+    """
+    def __init__(self, llm, model, summarization_depth="Moderate", chunked=False,
+                 chunk_tokens=None, max_concurrency=None):
+        self.llm = llm
+        self.model = model
+        self.limit = LIMITS[summarization_depth]
+        self.chunked = chunked
+        self.chunk_tokens = chunk_tokens or config.CHUNK_TOKENS
+        self.max_concurrency = max_concurrency or config.LLM_CONCURRENCY
+        self.summary_cache = get_summary_cache()
+        self.cache_stats = CacheStats()
+        self.rate_limiter = get_rate_limiter(model)
+
+    def summarize(self, content):
+        """Returns the summary of an article's content, truncated to the summarization depth."""
+        truncated_content = content[:self.limit] if self.limit else content
+        if not self.chunked:
+            return self.complete(PROMPT_TEMPLATE, truncated_content)
+
+        chunks = split_into_chunks(truncated_content, self.chunk_tokens)
+        if len(chunks) <= 1:
+            return self.complete(PROMPT_TEMPLATE, truncated_content)
+        partials = self.complete_all(CHUNK_PROMPT_TEMPLATE, chunks)
+        return self.reduce(partials)
+
+    def reduce(self, partials):
+        """Combines partial summaries, in several rounds if they don't fit in one prompt."""
+        while len(partials) > 1 and count_tokens("\n\n".join(partials)) > self.chunk_tokens:
+            groups = split_into_chunks("\n\n".join(partials), self.chunk_tokens)
+            if len(groups) >= len(partials):
+                break
+            partials = self.complete_all(REDUCE_PROMPT_TEMPLATE, groups)
+        return self.complete(REDUCE_PROMPT_TEMPLATE, "\n\n".join(partials))
+
+    def complete_all(self, prompt_template, contents):
+        runnable = RunnableLambda(lambda content: self.complete(prompt_template, content))
+        return runnable.batch(contents, config={"max_concurrency": self.max_concurrency})
+
+    def complete(self, prompt_template, content):
+        """Runs one prompt through the summary cache and, on a miss, the LLM."""
+        cache_key = summary_cache_key(content, prompt_template, self.model)
+        summary = self.summary_cache.get(cache_key)
+        self.cache_stats.record(summary is not None)
+        if summary is not None:
+            return summary
+
+        prompt = prompt_template.format(content=content)
+        prompt_tokens = estimate_tokens(prompt)
+
+        def invoke():
+            self.rate_limiter.acquire(prompt_tokens)
+            with get_llm_slots(), span(self.model, "llm_call", prompt_chars=len(prompt)):
+                return self.llm.invoke(prompt)
+
+        response = call_with_retry(invoke)
+        count("llm_calls")
+        count("chars_summarized", len(content))
+        usage = getattr(response, "usage_metadata", None) or {}
+        count("input_tokens", usage.get("input_tokens", prompt_tokens))
+        count("output_tokens", usage.get("output_tokens", 0))
+        summary = json.loads(response.content)["summary"]
+        self.summary_cache.set(cache_key, summary)
+        return summary
+
+
+def summarize_articles(doc_dict, llm, model, summarization_depth, progress, max_concurrency=None, chunked=False,
+                       completed=None, on_summary=None):
+    """
+    Summarizes every scraped article, running up to `max_concurrency` LLM calls at once.
 
-    doc_dict = state["scraped_articles"]
+    Args:
+        doc_dict (dict): Scraped articles per publication, as produced by scraping_router.
+        llm: The chat model used for summarization. Any LangChain chat model works,
+            e.g. a fake model in tests.
+        model (str): The model name, part of the summary cache key and rate limit bucket.
+        summarization_depth (str): One of the keys of LIMITS.
+        progress (ProgressBus): Receives progress events.
+        chunked (bool): Summarize long articles chunk by chunk (see Summarizer).
+        completed (dict, optional): Summary entries from an earlier attempt, keyed by
+            (publication, link); these articles are not summarized again.
+        on_summary (callable, optional): Called as `on_summary(publication, title, link, entry)`
+            for every newly summarized article.
+
+    Returns:
+        tuple: The summarized articles per publication and the summary cache statistics.
+    """
+    summarizer = Summarizer(llm, model, summarization_depth, chunked=chunked, max_concurrency=max_concurrency)
+
+    completed = completed or {}
+    jobs = []
     summarized_dict = {}
+    for publication, articles_dict in doc_dict.items():
+        if not articles_dict: continue
+        progress.write(f"- Summarizing articles from {publication}...")
+        summarized_dict[publication] = {}
+        for title, article_content_dict in articles_dict.items():
+            summarized_dict[publication][title] = completed.get((publication, article_content_dict["link"]))
+            if summarized_dict[publication][title] is None:
+                jobs.append((publication, title, article_content_dict))
+
+    runnable = RunnableLambda(lambda job: summarizer.summarize(job[2]["content"]))
+    batch_config = {"max_concurrency": summarizer.max_concurrency}
+    for index, result in runnable.batch_as_completed(jobs, config=batch_config, return_exceptions=True):
+        publication, title, article_content_dict = jobs[index]
+        if isinstance(result, Exception):
+            summarized_dict[publication][title] = f"Could not summarize article. Error: {result}"
+            continue
+        progress.write(f"Summarized '{title}'...", kind="article")
+        summarized_dict[publication][title] = {
+            "link": article_content_dict["link"],
+            "summary": result
+        }
+        if on_summary:
+            on_summary(publication, title, article_content_dict["link"], summarized_dict[publication][title])
+
+    return summarized_dict, summarizer.cache_stats.as_dict()
+
+
+@process_singleton
+def create_llm(model):
+    """
+    Returns the Gemini chat model that returns summaries as JSON. One client is
+    created per model and shared by every run of the process.
+
+    The client's own retries are disabled (with this SDK, 1 means a single
+    attempt; 0 means its default): call_with_retry owns the backoff, and every
+    attempt it makes goes through the rate limiter first.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    return ChatGoogleGenerativeAI(model=model, api_key=api_key, response_schema=output_schema, response_mime_type="application/json", transport="rest",
+                                  max_retries=1)
+
+
+def summarize_articles_node(state: OverallState) -> dict:
+    """Node for summarizing the content of scraped articles using an LLM."""
+    progress = get_progress(state.get("run_id"))
+    progress.write("Starting summarization process...")
+
     summarization_depth = state.get("summarization_depth", "Moderate")
     model = state["model"]
 
-    llm = ChatGoogleGenerativeAI(model=model, api_key=api_key, response_schema=output_schema, response_mime_type="application/json", transport="rest")
+    llm = create_llm(model)
 
-    limits = {
-        "Low": 10000,
-        "Moderate": 15000,
-        "High": 25000,
-        "Max": None
-    }
+    key = state.get("run_key")
+    store = get_run_store() if key else None
+    live_report = get_report_writer(state.get("run_id"))
 
-    for publication, articles_dict in doc_dict.items():
-            if not articles_dict: continue
-            ui_container.write(f"- Summarizing articles from {publication}...")
-
-            summarized_dict[publication] = {}
-            for title, article_content_dict in articles_dict.items():  
-                ui_container.write(f"Summarizing '{title}...'")       
-                try:
-                    limit = limits[summarization_depth]
-                    truncated_content = article_content_dict["content"][:limit] if limit else article_content_dict["content"]
-                    prompt = f"Summarize the following research article in 2-3 paragraphs, focusing on key findings and methodology.\n\n{truncated_content}"
-                    response = llm.invoke(prompt)
-
-                    summarized_dict[publication][title] = {}
-                    summarized_dict[publication][title]["link"] = article_content_dict["link"]
-                    summarized_dict[publication][title]["summary"] = json.loads(response.content)["summary"]
-
-                except Exception as e:
-                    summarized_dict[publication][title] = f"Could not summarize article. Error: {e}"
-
-    ui_container.write("- Summarization complete.")
-    return {"summarized_articles": summarized_dict}
\ No newline at end of file
+    def on_summary(publication, title, link, entry):
+        if store:
+            store.save_summary(key, publication, link, entry)
+        if live_report:
+            live_report[0].add(publication, title, entry)
+
+    summarized_dict, summary_cache_stats = summarize_articles(
+        state["scraped_articles"], llm, model, summarization_depth, progress,
+        max_concurrency=state.get("llm_concurrency"),
+        chunked=state.get("chunked_summarization", False),
+        completed=store.summaries(key) if store else None,
+        on_summary=on_summary
+    )
+
+    progress.write(
+        f"- Summarization complete. Summary cache: {summary_cache_stats['hits']} hits, {summary_cache_stats['misses']} misses."
+    )
+    return {"summarized_articles": summarized_dict, "summary_cache_stats": summary_cache_stats}
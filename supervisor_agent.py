@@ -1,34 +1,123 @@
-from overall_state import OverallState
-from langgraph.graph import StateGraph, START, END
-from scraper import scraping_router
-from summarization import summarize_articles_node
-from create_report import create_document
+from instrumentation import Tracer, traced_node, use_tracer
+from run_store import get_run_store, run_key
+from progress import LogSink, get_progress, open_run
+from report_writers import open_report_file
+from contextlib import nullcontext
+from waits import latency_stats
+from singletons import process_singleton
 
 
-OverallState = StateGraph(OverallState)
-OverallState.add_node("scrape_articles", scraping_router)
-OverallState.add_node("summarize_articles", summarize_articles_node)
-OverallState.add_node("create_report", create_document)
+def route_start(state):
+    """Sends streaming runs through the combined scrape/summarize node."""
+    return "scrape_and_summarize" if state.get("streaming") else "scrape_articles"
 
-OverallState.add_edge(START, "scrape_articles")
-OverallState.add_edge("scrape_articles", "summarize_articles")
-OverallState.add_edge("summarize_articles", "create_report")
-OverallState.add_edge("create_report", END)
 
-app = OverallState.compile()
+def build_graph():
+    """
+    Builds and compiles the research agent graph.
 
-def run_graph(prompt, summarization_depth, pages_to_search, page_depth, websites_to_search, model, status_ui):
+    The nodes and LangGraph are imported here rather than at module level, so
+    that importing this module (e.g. from the Streamlit app) stays cheap; the
+    Selenium, Gemini and LangGraph imports are paid once, by the first run.
+    """
+    from langgraph.graph import StateGraph, START, END
+    from overall_state import OverallState
+    from scraper import scraping_router
+    from summarization import summarize_articles_node
+    from create_report import create_document
+    from pipeline import scrape_and_summarize_node
+    from dedup import deduplicate_articles_node
+    from local_index import index_articles_node
+
+    graph = StateGraph(OverallState)
+    graph.add_node("scrape_articles", traced_node("scrape_articles", scraping_router))
+    graph.add_node("deduplicate_articles", traced_node("deduplicate_articles", deduplicate_articles_node))
+    graph.add_node("summarize_articles", traced_node("summarize_articles", summarize_articles_node))
+    graph.add_node("scrape_and_summarize", traced_node("scrape_and_summarize", scrape_and_summarize_node))
+    graph.add_node("index_articles", traced_node("index_articles", index_articles_node))
+    graph.add_node("create_report", traced_node("create_report", create_document))
+
+    graph.add_conditional_edges(START, route_start, ["scrape_articles", "scrape_and_summarize"])
+    graph.add_edge("scrape_articles", "deduplicate_articles")
+    graph.add_edge("deduplicate_articles", "summarize_articles")
+    graph.add_edge("summarize_articles", "index_articles")
+    graph.add_edge("scrape_and_summarize", "index_articles")
+    graph.add_edge("index_articles", "create_report")
+    graph.add_edge("create_report", END)
+    return graph.compile()
+
+
+@process_singleton
+def get_graph():
+    """Returns the compiled graph, built on first use and shared by every run of the process."""
+    return build_graph()
+
+
+def run_graph(prompt, summarization_depth, pages_to_search, page_depth, websites_to_search, model, status_ui=None, streaming=False, chunked=False, chrome_trace=False, resume=True,
+              report_format="docx", report_dir=None):
     """
     Invokes the research agent graph with the given inputs from the UI.
+    Progress messages are written to `status_ui` (any object with a `write`
+    method) at a fixed rate, or logged when it is None.
+    The report is built in `report_format` (a key of REPORT_WRITERS). With
+    `report_dir`, it is written to a file there while summaries arrive and the
+    final state carries "document_path" instead of "document_bytes".
+    With `streaming`, articles are summarized while the remaining ones are still being scraped.
+    With `chunked`, long articles are summarized chunk by chunk and the partial summaries combined.
+
+    Progress is saved to the run store under a key derived from the inputs. With
+    `resume`, a rerun with the same inputs within RUN_STORE_TTL reuses the
+    websites and summaries stored by the earlier attempt, whether it was
+    interrupted or finished, and only scrapes the websites that did not complete
+    without errors.
+
+    The final state also carries the run's instrumentation: "trace" (all spans and
+    counters), "stage_breakdown" (time per stage), "site_stats" (throughput and
+    errors per source), "site_latency" (the adaptive wait statistics per site)
+    and, with `chrome_trace`, the spans in Chrome trace format under "chrome_trace".
     """
-    initial_state = {
-        "messages": prompt,
+    params = {
+        "query": prompt[-1].content,
         "summarization_depth": summarization_depth,
         "pages_to_search": pages_to_search,
         "page_depth": page_depth,
-        "websites_to_search": websites_to_search,
+        "websites_to_search": sorted(websites_to_search),
         "model": model,
-        "ui_container": status_ui
+        "chunked": chunked
     }
-    final_state = app.invoke(initial_state)
-    return final_state
\ No newline at end of file
+    from scraper import site_stats
+
+    graph = get_graph()
+    key = run_key(params)
+    tracer = Tracer()
+    with open_run(status_ui or LogSink()) as run_id, use_tracer(tracer), \
+            (open_report_file(run_id, params["query"], report_dir, report_format) if report_dir else nullcontext()):
+        previous = get_run_store().start_run(key, params, resume=resume)
+        if previous == "finished":
+            get_progress(run_id).write("- Found a finished run with the same settings, reusing its results...")
+        elif previous:
+            get_progress(run_id).write("- Found an interrupted attempt with the same settings, resuming it...")
+
+        initial_state = {
+            "run_key": key,
+            "run_id": run_id,
+            "messages": prompt,
+            "summarization_depth": summarization_depth,
+            "pages_to_search": pages_to_search,
+            "page_depth": page_depth,
+            "websites_to_search": websites_to_search,
+            "model": model,
+            "streaming": streaming,
+            "chunked_summarization": chunked,
+            "report_format": report_format
+        }
+        final_state = graph.invoke(initial_state)
+    get_run_store().finish_run(key)
+
+    final_state["trace"] = tracer.to_dict()
+    final_state["stage_breakdown"] = tracer.breakdown()
+    final_state["site_stats"] = site_stats(final_state["trace"])
+    final_state["site_latency"] = latency_stats()
+    if chrome_trace:
+        final_state["chrome_trace"] = tracer.to_chrome_trace()
+    return final_state
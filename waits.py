@@ -0,0 +1,132 @@
+from selenium.common.exceptions import TimeoutException
+from collections import deque
+from urllib.parse import urlparse
+from instrumentation import count
+from sites import SITES, site_base_url
+import threading
+import time
+import config
+
+
+class WaitPolicy:
+    """
+    Adaptive timeout for one kind of wait on one site (e.g. IEEE article pages).
+
+    Successful wait durations are kept in a rolling window. Until
+    WAIT_MIN_SAMPLES have been seen the timeout is WAIT_INITIAL_TIMEOUT;
+    afterwards it is WAIT_P95_FACTOR times the rolling p95, clamped between
+    WAIT_MIN_TIMEOUT and WAIT_MAX_TIMEOUT. Each consecutive timeout multiplies
+    the timeout by WAIT_BACKOFF_FACTOR, up to WAIT_MAX_TIMEOUT, so a site that
+    became slower than its samples gets more time; a success resets the backoff.
+    """
+    def __init__(self, window=None):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window or config.WAIT_WINDOW)
+        self.successes = 0
+        self.timeouts = 0
+        self._consecutive_timeouts = 0
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+            self.successes += 1
+            self._consecutive_timeouts = 0
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+            self._consecutive_timeouts += 1
+
+    def percentile(self, fraction):
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, round(fraction * (len(samples) - 1)))]
+
+    def timeout(self):
+        with self._lock:
+            enough = len(self._samples) >= config.WAIT_MIN_SAMPLES
+            backoff = config.WAIT_BACKOFF_FACTOR ** min(self._consecutive_timeouts, 32)
+        if not enough:
+            base = config.WAIT_INITIAL_TIMEOUT
+        else:
+            base = max(config.WAIT_MIN_TIMEOUT, self.percentile(0.95) * config.WAIT_P95_FACTOR)
+        return min(config.WAIT_MAX_TIMEOUT, base * backoff)
+
+    def stats(self):
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        return {
+            "successes": self.successes,
+            "timeouts": self.timeouts,
+            "p50_s": round(p50, 3) if p50 is not None else None,
+            "p95_s": round(p95, 3) if p95 is not None else None,
+            "timeout_s": round(self.timeout(), 2)
+        }
+
+
+_policies = {}
+_policies_lock = threading.Lock()
+
+def get_wait_policy(site, phase):
+    """Returns the process-wide wait policy for a site and phase ("page_load", "results" or "article")."""
+    with _policies_lock:
+        if (site, phase) not in _policies:
+            _policies[(site, phase)] = WaitPolicy()
+        return _policies[(site, phase)]
+
+
+def latency_stats():
+    """Returns the latency statistics of every site and phase seen by this process."""
+    with _policies_lock:
+        policies = dict(_policies)
+    stats = {}
+    for (site, phase), policy in sorted(policies.items()):
+        stats.setdefault(site, {})[phase] = policy.stats()
+    return stats
+
+
+def site_for_url(url):
+    """Returns the name of the site whose base URL `url` is under, or its domain."""
+    for site in SITES.values():
+        if url.startswith(site_base_url(site).rstrip("/") + "/"):
+            return site.name
+    return urlparse(url).netloc.lower()
+
+
+def wait_for(driver, site, phase, locator):
+    """
+    Waits until the element at `locator` is present and returns it.
+
+    The timeout comes from the site's wait policy. The wait also fails fast when
+    the page has finished loading and the element still has not appeared after
+    WAIT_AFTER_LOAD seconds, which is the case for error pages and pages that
+    won't yield content.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    policy = get_wait_policy(site, phase)
+    start = time.monotonic()
+    loaded_at = None
+
+    def located(driver):
+        nonlocal loaded_at
+        elements = driver.find_elements(*locator)
+        if elements:
+            return elements[0]
+        now = time.monotonic()
+        if loaded_at is None:
+            if driver.execute_script("return document.readyState") == "complete":
+                loaded_at = now
+        elif now - loaded_at > config.WAIT_AFTER_LOAD:
+            raise TimeoutException(f"{locator[1]} did not appear {config.WAIT_AFTER_LOAD}s after the page loaded.")
+        return False
+
+    try:
+        element = WebDriverWait(driver, policy.timeout(), poll_frequency=0.2).until(located)
+    except TimeoutException:
+        policy.record_timeout()
+        count("wait_timeouts")
+        raise
+    policy.record(time.monotonic() - start)
+    return element